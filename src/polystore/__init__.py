@@ -29,19 +29,7 @@ from .base import (
     get_backend,
 )
 from .constants import Backend, MemoryType, TransportMode
-from .disk import DiskBackend, DiskStorageBackend
-from .filemanager import FileManager
 from .formats import FileFormat, DEFAULT_IMAGE_EXTENSIONS
-from .memory import MemoryBackend, MemoryStorageBackend
-from .metadata_writer import (
-    AtomicMetadataWriter,
-    MetadataWriteError,
-    METADATA_CONFIG,
-    get_metadata_path,
-    get_subdirectory_name,
-    resolve_subdirectory_path,
-)
-from .metadata_migration import detect_legacy_format, migrate_legacy_metadata, migrate_plate_metadata
 from .roi import (
     ROI,
     PolygonShape,
@@ -56,7 +44,6 @@ from .roi import (
 )
 from .streaming import StreamingBackend
 from .streaming_constants import StreamingDataType, NapariShapeType
-from .virtual_workspace import SourcePixelRef
 
 __all__ = [
     "Backend",
@@ -121,28 +108,65 @@ __all__ = [
     "OMEROFileFormatRegistry",
 ]
 
-_LAZY_BACKEND_REGISTRY = {
-    "NapariStreamingBackend": ("polystore.napari_stream", "NapariStreamingBackend"),
-    "FijiStreamingBackend": ("polystore.fiji_stream", "FijiStreamingBackend"),
-    "ZarrStorageBackend": ("polystore.zarr", "ZarrStorageBackend"),
-    "OMEROLocalBackend": ("polystore.omero_local", "OMEROLocalBackend"),
-    "OMEROFileFormatRegistry": ("polystore.omero_local", "OMEROFileFormatRegistry"),
+# Lazily resolved exports, declared once per submodule. Attributes are
+# imported on first access and cached in module globals.
+_LAZY_SUBMODULE_ATTRS = {
+    "polystore.disk": ("DiskBackend", "DiskStorageBackend"),
+    "polystore.memory": ("MemoryBackend", "MemoryStorageBackend"),
+    "polystore.filemanager": ("FileManager",),
+    "polystore.metadata_writer": (
+        "AtomicMetadataWriter",
+        "MetadataWriteError",
+        "METADATA_CONFIG",
+        "get_metadata_path",
+        "get_subdirectory_name",
+        "resolve_subdirectory_path",
+    ),
+    "polystore.metadata_migration": (
+        "detect_legacy_format",
+        "migrate_legacy_metadata",
+        "migrate_plate_metadata",
+    ),
+    "polystore.virtual_workspace": ("SourcePixelRef",),
+    "polystore.napari_stream": ("NapariStreamingBackend",),
+    "polystore.fiji_stream": ("FijiStreamingBackend",),
+    "polystore.zarr": ("ZarrStorageBackend",),
+    "polystore.omero_local": ("OMEROLocalBackend", "OMEROFileFormatRegistry"),
 }
 
+_LAZY_ATTRS = {
+    attr_name: module_path
+    for module_path, attr_names in _LAZY_SUBMODULE_ATTRS.items()
+    for attr_name in attr_names
+}
+
+# Optional backends replaced by placeholders in GPU-free subprocesses
+_OPTIONAL_BACKEND_EXPORTS = frozenset({
+    "NapariStreamingBackend",
+    "FijiStreamingBackend",
+    "ZarrStorageBackend",
+    "OMEROLocalBackend",
+    "OMEROFileFormatRegistry",
+})
+
 
 def __getattr__(name):
-    """Lazy import of optional/extra backend classes."""
-    if name not in _LAZY_BACKEND_REGISTRY:
+    """Lazy import of core exports and optional/extra backend classes."""
+    if name not in _LAZY_ATTRS:
         raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
 
-    if os.getenv("POLYSTORE_SUBPROCESS_NO_GPU") == "1":
+    if name in _OPTIONAL_BACKEND_EXPORTS and os.getenv("POLYSTORE_SUBPROCESS_NO_GPU") == "1":
         class PlaceholderBackend:
             pass
         PlaceholderBackend.__name__ = name
         PlaceholderBackend.__qualname__ = name
         return PlaceholderBackend
 
-    module_path, class_name = _LAZY_BACKEND_REGISTRY[name]
     import importlib
-    module = importlib.import_module(module_path)
-    return getattr(module, class_name)
+    value = getattr(importlib.import_module(_LAZY_ATTRS[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
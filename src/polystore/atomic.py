@@ -76,9 +76,9 @@ def file_lock(
 
 def _acquire_lock_with_timeout(lock_path: Path, timeout: float, poll_interval: float) -> int:
     """Acquire file lock with timeout and return file descriptor."""
-    deadline = time.time() + timeout
+    deadline = time.monotonic() + timeout
 
-    while time.time() < deadline:
+    while time.monotonic() < deadline:
         if lock_fd := _try_acquire_lock(lock_path):
             return lock_fd
         time.sleep(poll_interval)
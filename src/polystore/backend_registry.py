@@ -34,9 +34,7 @@ def get_backend_instance(backend_type: str) -> DataSink:
         KeyError: If backend type not registered
         RuntimeError: If backend instantiation fails
     """
-    if hasattr(backend_type, "value"):
-        backend_type = backend_type.value
-    backend_type = str(backend_type).lower()
+    backend_type = str(getattr(backend_type, "value", backend_type)).lower()
 
     # Return cached instance if available
     if backend_type in _backend_instances:
@@ -116,15 +114,17 @@ def cleanup_backend_connections() -> None:
 
     for backend_type, instance in _backend_instances.items():
         # Use targeted cleanup for napari streaming to preserve window
-        if hasattr(instance, 'cleanup_connections'):
+        cleanup_connections = getattr(instance, 'cleanup_connections', None)
+        cleanup = getattr(instance, 'cleanup', None)
+        if cleanup_connections is not None:
             try:
-                instance.cleanup_connections()
+                cleanup_connections()
                 logger.debug(f"Cleaned up connections for backend '{backend_type}'")
             except Exception as e:
                 logger.warning(f"Failed to cleanup connections for backend '{backend_type}': {e}")
-        elif hasattr(instance, 'cleanup') and backend_type != 'napari_stream':
+        elif cleanup is not None and backend_type != 'napari_stream':
             try:
-                instance.cleanup()
+                cleanup()
                 logger.debug(f"Cleaned up backend '{backend_type}'")
             except Exception as e:
                 logger.warning(f"Failed to cleanup backend '{backend_type}': {e}")
@@ -148,9 +148,10 @@ def cleanup_all_backends() -> None:
     Use cleanup_backend_connections() for test cleanup to preserve napari window.
     """
     for backend_type, instance in _backend_instances.items():
-        if hasattr(instance, 'cleanup'):
+        cleanup = getattr(instance, 'cleanup', None)
+        if cleanup is not None:
             try:
-                instance.cleanup()
+                cleanup()
                 logger.debug(f"Cleaned up backend '{backend_type}'")
             except Exception as e:
                 logger.warning(f"Failed to cleanup backend '{backend_type}': {e}")
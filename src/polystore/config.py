@@ -7,7 +7,7 @@ from dataclasses import dataclass
 from enum import Enum
 from typing import Any, ClassVar
 
-from metaclass_registry import AutoRegisterMeta
+from .registry import AutoRegisterMeta
 
 
 class ZarrCompressor(Enum):
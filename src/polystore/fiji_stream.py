@@ -5,13 +5,17 @@ Streams image data to Fiji/ImageJ viewer using ZMQ for IPC.
 Follows same architecture as Napari streaming for consistency.
 
 SHARED MEMORY OWNERSHIP MODEL:
-- Sender (Worker): Creates shared memory, sends reference via ZMQ, closes handle (does NOT unlink)
-- Receiver (Fiji Server): Attaches to shared memory, copies data, closes handle, unlinks
-- Only receiver calls unlink() to prevent FileNotFoundError
+- Sender (Worker): Creates shared memory, sends reference via ZMQ, owns the allocation
+- Receiver (Fiji Server): Attaches to shared memory, copies data, closes handle
+- Sender unlinks each block once the batch is acknowledged; a receiver that
+  unlinks first is tolerated (the sender skips the missing name)
+- SHM_POOL_MAX_BYTES > 0 keeps acknowledged blocks for reuse instead; only
+  enable it when the receiver never unlinks sender memory
 - REQ/REP socket pattern ensures receiver copies data before sender closes handle
 """
 
 import logging
+from collections import Counter
 from enum import Enum
 
 from .constants import Backend
@@ -115,25 +119,17 @@ class FijiStreamingBackend(StreamingBackend):
         stream_request: ViewerStreamRequest,
         built_batch: StreamingBuiltBatch,
     ) -> None:
+        if not logger.isEnabledFor(logging.INFO):
+            return
         logger.info(
             "🏷️  FIJI BACKEND: Final component_names_metadata: %s",
             FijiMessageMetadata.component_names_metadata(built_batch.message),
         )
 
-        for item in built_batch.batch_images:
-            logger.info(
-                "🔍 FIJI BACKEND: Added %s item to batch",
-                item[ViewerBatchItemWireField.DATA_TYPE.value],
-            )
-
-        data_types = [
-            item[ViewerBatchItemWireField.DATA_TYPE.value]
-            for item in built_batch.batch_images
-        ]
-        type_counts = {
-            data_type: data_types.count(data_type)
-            for data_type in set(data_types)
-        }
+        data_type_field = ViewerBatchItemWireField.DATA_TYPE.value
+        type_counts = dict(
+            Counter(item[data_type_field] for item in built_batch.batch_images)
+        )
         logger.info(
             "📤 FIJI BACKEND: Sending batch message with %d items to port %s: %s",
             len(built_batch.batch_images),
@@ -156,9 +152,8 @@ class FijiStreamingBackend(StreamingBackend):
         Returns:
             Dict with ROI data
         """
-        # Convert ROI objects to bytes, then base64 encode for transmission
-        roi_bytes_list = FijiROIConverter.rois_to_imagej_bytes(data)
-        rois_encoded = FijiROIConverter.encode_rois_for_transmission(roi_bytes_list)
+        # Convert ROI objects to base64-encoded ImageJ bytes in a single pass
+        rois_encoded = FijiROIConverter.rois_to_transmission(data)
 
         return {
             ViewerBatchItemWireField.PATH.value: str(file_path),
@@ -169,30 +164,23 @@ class FijiStreamingBackend(StreamingBackend):
         self,
         request: StreamingItemPreparationRequest,
     ) -> ViewerStreamItemPayload:
-        logger.info(
-            "🔍 FIJI BACKEND: Detected data type: %s for path: %s",
+        logger.debug(
+            "FIJI BACKEND: Detected data type: %s for path: %s",
             request.streaming_data_type,
             request.item_path.value,
         )
         if request.streaming_data_type == StreamingDataType.SHAPES:
-            logger.info(
-                "🔍 FIJI BACKEND: Preparing ROI data for %s",
-                request.item_path.value,
-            )
             item_data = self._prepare_rois_data(
                 request.data,
                 request.item_path.value,
             )
             output_streaming_data_type = StreamingDataType.ROIS
-            logger.info(
-                "🔍 FIJI BACKEND: ROI data prepared: %d ROIs",
-                FijiRoiPayload.count(item_data),
-            )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "FIJI BACKEND: ROI data prepared: %d ROIs",
+                    FijiRoiPayload.count(item_data),
+                )
         else:
-            logger.info(
-                "🔍 FIJI BACKEND: Preparing image data for %s",
-                request.item_path.value,
-            )
             item_data = self.create_shared_memory_payload(
                 request.data,
                 request.item_path.value,
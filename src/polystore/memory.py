@@ -18,6 +18,7 @@ from typing import Any, Dict, List, Optional, Set, Union
 from .base import StorageBackend
 from .constants import Backend
 from .exceptions import StorageResolutionError
+from .utils import compile_filename_pattern
 
 logger = logging.getLogger(__name__)
 
@@ -180,8 +181,6 @@ class MemoryStorageBackend(StorageBackend):
         extensions: Optional[Set[str]] = None,
         recursive: bool = False
     ) -> List[Path]:
-        from fnmatch import fnmatch
-
         dir_key = self._normalize(directory)
 
         # Check if directory exists and is a directory
@@ -195,6 +194,7 @@ class MemoryStorageBackend(StorageBackend):
         )
         result = []
         dir_prefix = dir_key + "/" if not dir_key.endswith("/") else dir_key
+        matches_pattern = compile_filename_pattern(pattern)
 
         for path, value in list(self._memory_store.items()):
             # Skip if not under this directory
@@ -212,7 +212,7 @@ class MemoryStorageBackend(StorageBackend):
             if value is not None:
                 filename = Path(rel_path).name
                 # If pattern is None, match all files
-                if pattern is None or fnmatch(filename, pattern):
+                if matches_pattern is None or matches_pattern(filename):
                     if (
                         lowercase_extensions is None
                         or Path(filename).suffix.lower() in lowercase_extensions
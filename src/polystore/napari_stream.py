@@ -6,16 +6,23 @@ for real-time visualization during pipeline execution. Uses ZeroMQ for IPC
 and shared memory for efficient data transfer.
 
 SHARED MEMORY OWNERSHIP MODEL:
-- Sender (Worker): Creates shared memory, sends reference via ZMQ, closes handle (does NOT unlink)
-- Receiver (Napari Server): Attaches to shared memory, copies data, closes handle, unlinks
-- Only receiver calls unlink() to prevent FileNotFoundError
+- Sender (Worker): Creates shared memory, sends reference via ZMQ, owns the allocation
+- Receiver (Napari Server): Attaches to shared memory, copies data, closes handle
+- Sender unlinks each block once the batch is acknowledged; a receiver that
+  unlinks first is tolerated (the sender skips the missing name)
+- SHM_POOL_MAX_BYTES > 0 keeps acknowledged blocks for reuse instead; only
+  enable it when the receiver never unlinks sender memory
 - REQ/REP socket pattern is blocking; worker waits for acknowledgment before closing shared memory
 """
 
 import logging
+from collections.abc import Callable, Mapping
 from enum import Enum
+from types import MappingProxyType
+from typing import ClassVar
 
 from .constants import Backend
+from .streaming_constants import StreamingDataType
 from .streaming import (
     FilePath,
     RoiStreamPayload,
@@ -98,17 +105,29 @@ class NapariStreamingBackend(StreamingBackend):
             ViewerBatchItemWireField.SHAPES.value: shapes_data,
         }
 
+    # Vector payload builders by data type; every other type streams as an image
+    VECTOR_PAYLOAD_BUILDERS: ClassVar[
+        Mapping[StreamingDataType, Callable[..., dict[str, ViewerWireValue]]]
+    ] = MappingProxyType({
+        StreamingDataType.SHAPES: _prepare_shapes_data,
+        StreamingDataType.POINTS: _prepare_shapes_data,
+    })
+
     def _prepare_batch_item(
         self,
         request: StreamingItemPreparationRequest,
     ) -> ViewerStreamItemPayload:
-        if request.streaming_data_type.uses_napari_vector_payload:
-            item_data = self._prepare_shapes_data(
+        build_vector_payload = self.VECTOR_PAYLOAD_BUILDERS.get(
+            request.streaming_data_type
+        )
+        if build_vector_payload is None:
+            item_data = self.create_shared_memory_payload(
                 request.data,
                 request.item_path.value,
             )
         else:
-            item_data = self.create_shared_memory_payload(
+            item_data = build_vector_payload(
+                self,
                 request.data,
                 request.item_path.value,
             )
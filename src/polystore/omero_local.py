@@ -11,7 +11,7 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from pathlib import Path, PurePosixPath
 from typing import Any, Dict, List, Mapping, Optional, Set, Union, Tuple
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
 from datetime import datetime
 import threading
 
@@ -27,6 +27,7 @@ import numpy as np
 
 from .base import VirtualBackend, PicklableBackend, storage_registry
 from .formats import FileFormat
+from .utils import compile_filename_pattern
 
 logger = logging.getLogger(__name__)
 
@@ -93,6 +94,53 @@ class PlateStructure:
     max_t: int
 
 
+class OMEROPixelsCache:
+    """Bounded image_id → primary pixels cache bound to one OMERO connection.
+
+    Pixels wrappers hold their connection, so the cache empties itself when a
+    different connection is used and is never pickled with the backend.
+    """
+
+    MAX_ENTRIES = 4096
+
+    def __init__(self, max_entries: int = MAX_ENTRIES):
+        self._max_entries = max_entries
+        self._conn = None
+        self._entries: "OrderedDict[int, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _bind(self, conn) -> None:
+        if conn is not self._conn:
+            self._entries.clear()
+            self._conn = conn
+
+    def get(self, conn, image_id: int):
+        with self._lock:
+            self._bind(conn)
+            pixels = self._entries.get(image_id)
+            if pixels is not None:
+                self._entries.move_to_end(image_id)
+            return pixels
+
+    def put(self, conn, image_id: int, pixels) -> None:
+        with self._lock:
+            self._bind(conn)
+            self._entries[image_id] = pixels
+            self._entries.move_to_end(image_id)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def missing(self, conn, image_ids) -> List[int]:
+        with self._lock:
+            self._bind(conn)
+            return [image_id for image_id in image_ids if image_id not in self._entries]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._conn = None
+
+
 class OMEROLocalBackend(VirtualBackend, PicklableBackend):
     """
     Virtual backend for OMERO server-side execution.
@@ -185,6 +233,7 @@ class OMEROLocalBackend(VirtualBackend, PicklableBackend):
         self._plate_metadata: Dict[int, PlateStructure] = {}
         self._parser_cache: Dict[int, Any] = {}  # plate_id → parser instance
         self._plate_name_cache: Dict[str, int] = {}  # plate_name → plate_id
+        self._pixels_cache = OMEROPixelsCache()  # image_id → primary pixels
 
         # Namespace configuration
         self._namespace_prefix = namespace_prefix
@@ -229,11 +278,13 @@ class OMEROLocalBackend(VirtualBackend, PicklableBackend):
         state = self.__dict__.copy()
         # Remove unpicklable connection
         state['_initial_conn'] = None
+        state.pop('_pixels_cache', None)
         return state
 
     def __setstate__(self, state):
         """Restore state after unpickling."""
         self.__dict__.update(state)
+        self._pixels_cache = OMEROPixelsCache()
         # Connection will be retrieved from global registry in worker process
 
     def get_connection_params(self) -> Optional[Dict[str, Any]]:
@@ -385,19 +436,28 @@ class OMEROLocalBackend(VirtualBackend, PicklableBackend):
         conn = self._get_connection(**kwargs)
 
         # Query OMERO for plate with retry mechanism
-        # Plates may need time to become available after upload
-        max_retries = 30
-        retry_delay = 1.0
-        
-        for attempt in range(max_retries):
+        # Plates may need time to become available after upload; back off
+        # exponentially so a plate that appears quickly is not held for a
+        # full fixed delay, while keeping the same overall wait budget
+        retry_timeout = 30.0
+        retry_delay = 0.05
+        max_retry_delay = 1.0
+        deadline = time.monotonic() + retry_timeout
+
+        attempt = 0
+        while True:
             plate = conn.getObject("Plate", plate_id)
             if plate:
                 break
-            if attempt < max_retries - 1:
-                logger.info(f"Plate {plate_id} not found yet, retrying in {retry_delay}s (attempt {attempt + 1}/{max_retries})")
-                time.sleep(retry_delay)
-            else:
-                raise ValueError(f"OMERO Plate not found after {max_retries} retries: {plate_id}")
+            attempt += 1
+            if time.monotonic() + retry_delay > deadline:
+                raise ValueError(
+                    f"OMERO Plate not found after {attempt} attempts in {retry_timeout}s: {plate_id}"
+                )
+            logger.info("Plate %s not found yet, retrying in %.2fs (attempt %d)",
+                        plate_id, retry_delay, attempt)
+            time.sleep(retry_delay)
+            retry_delay = min(retry_delay * 2, max_retry_delay)
 
         # Get parser metadata
         parser_name = self._get_parser_from_plate_metadata(plate)
@@ -477,6 +537,17 @@ class OMEROLocalBackend(VirtualBackend, PicklableBackend):
         Returns:
             2D numpy array (single z-plane, single channel, single timepoint)
         """
+        image_id, zct = self._resolve_plane(file_path, **kwargs)
+        pixels = self._get_pixels(image_id, **kwargs)
+        plane = pixels.getPlane(*zct)  # Returns 2D numpy array
+
+        logger.debug("Loaded %s → image %s, z=%d, c=%d, t=%d, shape=%s",
+                     Path(file_path).name, image_id, *zct, plane.shape)
+
+        return plane
+
+    def _resolve_plane(self, file_path: Union[str, Path], **kwargs) -> Tuple[int, Tuple[int, int, int]]:
+        """Resolve a virtual plane path to its OMERO image id and 0-based (z, c, t)."""
         # Extract plate_id from path using parent directory
         # Path format: /omero/plate_59/A01_s001_w1_z001_t001.tif
         path_obj = Path(file_path)
@@ -530,19 +601,32 @@ class OMEROLocalBackend(VirtualBackend, PicklableBackend):
         if t_idx >= image_struct.sizeT:
             raise ValueError(f"Timepoint {t_idx} out of range (max: {image_struct.sizeT})")
 
-        # Load plane from OMERO
-        conn = self._get_connection(**kwargs)
-        image = conn.getObject("Image", image_struct.image_id)
-        if not image:
-            raise ValueError(f"OMERO Image not found: {image_struct.image_id}")
-
-        pixels = image.getPrimaryPixels()
-        plane = pixels.getPlane(z_idx, c_idx, t_idx)  # Returns 2D numpy array
+        return image_struct.image_id, (z_idx, c_idx, t_idx)
 
-        logger.debug(f"Loaded {filename} → image {image_struct.image_id}, "
-                     f"z={z_idx}, c={c_idx}, t={t_idx}, shape={plane.shape}")
+    def _get_pixels(self, image_id: int, **kwargs):
+        """Return the primary pixels wrapper for an OMERO image.
 
-        return plane
+        Wrappers are cached per image so repeated plane loads skip the
+        ``getObject`` round-trip to the server.
+        """
+        conn = self._get_connection(**kwargs)
+        pixels = self._pixels_cache.get(conn, image_id)
+        if pixels is None:
+            image = conn.getObject("Image", image_id)
+            if not image:
+                raise ValueError(f"OMERO Image not found: {image_id}")
+            pixels = image.getPrimaryPixels()
+            self._pixels_cache.put(conn, image_id, pixels)
+        return pixels
+
+    def prefetch_pixels(self, image_ids: List[int], **kwargs) -> None:
+        """Resolve pixels for many images with a single ``getObjects`` query."""
+        conn = self._get_connection(**kwargs)
+        missing = self._pixels_cache.missing(conn, image_ids)
+        if not missing:
+            return
+        for image in conn.getObjects("Image", missing):
+            self._pixels_cache.put(conn, image.getId(), image.getPrimaryPixels())
 
     def save(self, data: Any, output_path: Union[str, Path], **kwargs) -> None:
         """
@@ -927,19 +1011,13 @@ class OMEROLocalBackend(VirtualBackend, PicklableBackend):
         else:
             raise ValueError(f"Data must be 3D or 4D, got {data.shape}")
 
-        # Plane generator
-        def planes():
-            if data.ndim == 3:
-                for z in range(sizeZ):
-                    yield data[z]
-            else:
-                for z in range(sizeZ):
-                    for c in range(sizeC):
-                        yield data[z, c]
+        # Planes in Z-major, C-minor order; iterating a contiguous
+        # (planes, Y, X) view yields each plane as a view without copies
+        planes = np.ascontiguousarray(data).reshape(sizeZ * sizeC, sizeY, sizeX)
 
         # Create image
         new_image = conn.createImageFromNumpySeq(
-            planes(),
+            iter(planes),
             image_name,
             sizeZ=sizeZ,
             sizeC=sizeC,
@@ -1253,30 +1331,31 @@ class OMEROLocalBackend(VirtualBackend, PicklableBackend):
             sizeT = img_data['max_t']
 
             # Generate all planes in ZCT order with padding
-            def plane_generator():
+            def plane_generator(planes=img_data['planes']):
+                # Missing planes all share one read-only zero plane
+                empty_plane = np.zeros((max_height, max_width), dtype=dtype)
+                empty_plane.flags.writeable = False
                 for t in range(sizeT):
                     for c in range(sizeC):
                         for z in range(sizeZ):
-                            key = (z, c, t)
-                            if key in img_data['planes']:
-                                data = img_data['planes'][key]
-
-                                # Convert CuPy arrays to NumPy (OMERO requires NumPy)
-                                if hasattr(data, 'get'):  # CuPy array
-                                    data = data.get()
-
-                                h, w = data.shape
-
-                                # Pad if needed
-                                if h < max_height or w < max_width:
-                                    padded = np.zeros((max_height, max_width), dtype=dtype)
-                                    padded[:h, :w] = data
-                                    yield padded
-                                else:
-                                    yield data
+                            data = planes.get((z, c, t))
+                            if data is None:
+                                yield empty_plane
+                                continue
+
+                            # Convert CuPy arrays to NumPy (OMERO requires NumPy)
+                            if hasattr(data, 'get'):  # CuPy array
+                                data = data.get()
+
+                            h, w = data.shape
+
+                            # Pad if needed
+                            if h < max_height or w < max_width:
+                                padded = np.zeros((max_height, max_width), dtype=dtype)
+                                padded[:h, :w] = data
+                                yield padded
                             else:
-                                # Missing plane - yield zeros
-                                yield np.zeros((max_height, max_width), dtype=dtype)
+                                yield data
 
             # Create complete image with all planes at once
             image = conn.createImageFromNumpySeq(
@@ -1365,7 +1444,7 @@ class OMEROLocalBackend(VirtualBackend, PicklableBackend):
 
         Args:
             directory: Path containing plate ID (e.g., "/17/Images" or "17")
-            pattern: File pattern (currently ignored)
+            pattern: Glob pattern matched against generated filenames
             extensions: File extensions (currently ignored)
             recursive: Recursion flag (currently ignored)
             **kwargs: Additional backend-specific arguments (unused)
@@ -1401,7 +1480,10 @@ class OMEROLocalBackend(VirtualBackend, PicklableBackend):
         plate_struct = self._plate_metadata[plate_id]
         parser = self._parser_cache[plate_id]
 
-        # Generate filenames on-the-fly
+        # Generate filenames on-the-fly; the pattern is compiled once for
+        # the whole plate rather than re-matched through fnmatch per name
+        construct_filename = parser.construct_filename
+        matches_pattern = compile_filename_pattern(pattern)
         filenames = []
         for well_id, well_struct in plate_struct.wells.items():
             for site_idx, image_struct in well_struct.sites.items():
@@ -1409,7 +1491,7 @@ class OMEROLocalBackend(VirtualBackend, PicklableBackend):
                 for t in range(image_struct.sizeT):
                     for z in range(image_struct.sizeZ):
                         for c in range(image_struct.sizeC):
-                            filename = parser.construct_filename(
+                            filename = construct_filename(
                                 well=well_id,
                                 site=site_idx,
                                 channel=c + 1,
@@ -1417,7 +1499,8 @@ class OMEROLocalBackend(VirtualBackend, PicklableBackend):
                                 timepoint=t + 1,
                                 extension='.tif'
                             )
-                            filenames.append(filename)
+                            if matches_pattern is None or matches_pattern(filename):
+                                filenames.append(filename)
 
         logger.debug(f"Generated {len(filenames)} filenames on-demand for plate {plate_id}")
         return filenames
@@ -1462,8 +1545,26 @@ class OMEROLocalBackend(VirtualBackend, PicklableBackend):
         pass
 
     def load_batch(self, file_paths: List[Union[str, Path]], **kwargs) -> List[Any]:
-        """Load multiple images from OMERO."""
-        return [self.load(fp, **kwargs) for fp in file_paths]
+        """Load multiple images from OMERO.
+
+        Planes are grouped by image so each image's planes are read through one
+        raw pixels store via ``getPlanes`` instead of one store per plane.
+        """
+        planes_by_image: Dict[int, List[Tuple[int, Tuple[int, int, int]]]] = defaultdict(list)
+        for index, file_path in enumerate(file_paths):
+            image_id, zct = self._resolve_plane(file_path, **kwargs)
+            planes_by_image[image_id].append((index, zct))
+
+        self.prefetch_pixels(list(planes_by_image), **kwargs)
+        results: List[Any] = [None] * len(file_paths)
+        for image_id, planes in planes_by_image.items():
+            pixels = self._get_pixels(image_id, **kwargs)
+            zct_list = [zct for _, zct in planes]
+            for (index, _), plane in zip(
+                planes, pixels.getPlanes(zct_list), strict=True
+            ):
+                results[index] = plane
+        return results
 
     def _save_rois(self, rois: List, output_path: Path, images_dir: str = None, **kwargs) -> str:
         """Save ROIs to OMERO by linking to images in the materialized plate.
@@ -13,7 +13,6 @@ from pathlib import Path
 from typing import Any, ClassVar, Dict, List, Optional, Tuple, Union
 
 import numpy as np
-from metaclass_registry import AutoRegisterMeta
 from zmqruntime.viewer_protocol import (
     ViewerSourceSpatialDomainPayload,
     ViewerSourceSpatialWireField,
@@ -21,6 +20,7 @@ from zmqruntime.viewer_protocol import (
 
 from .constants import Backend
 from .formats import FileFormat
+from .registry import AutoRegisterMeta
 
 logger = logging.getLogger(__name__)
 
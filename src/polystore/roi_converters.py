@@ -6,6 +6,7 @@ Provides a single source of truth for converting ROI objects to:
 - ImageJ ROI bytes
 """
 
+import base64
 import logging
 from abc import ABC, abstractmethod
 from collections.abc import Mapping, Sequence
@@ -14,7 +15,7 @@ from enum import Enum
 from typing import Any, ClassVar, Dict, List, Tuple
 
 import numpy as np
-from metaclass_registry import AutoRegisterMeta
+from .registry import AutoRegisterMeta
 
 from .roi import (
     EllipseShape,
@@ -509,7 +510,9 @@ class PolygonImageJROIShapeConverter(ImageJROIShapeConverter):
     def imagej_roi(self, shape: PolygonShape, name: str) -> Any:
         from roifile import ImagejRoi
 
-        imagej_roi = ImagejRoi.frompoints(shape.coordinates[:, [1, 0]])
+        # frompoints copies its input, so a reversed-column view avoids a
+        # second fancy-indexing copy of the vertex array.
+        imagej_roi = ImagejRoi.frompoints(shape.coordinates[:, ::-1])
         imagej_roi.name = name
         return imagej_roi
 
@@ -520,7 +523,7 @@ class PolylineImageJROIShapeConverter(ImageJROIShapeConverter):
     def imagej_roi(self, shape: PolylineShape, name: str) -> Any:
         from roifile import ImagejRoi, ROI_TYPE
 
-        imagej_roi = ImagejRoi.frompoints(shape.coordinates[:, [1, 0]])
+        imagej_roi = ImagejRoi.frompoints(shape.coordinates[:, ::-1])
         imagej_roi.roitype = ROI_TYPE.POLYLINE
         imagej_roi.name = name
         return imagej_roi
@@ -622,19 +625,23 @@ class FijiROIConverter:
             raise ImportError("roifile library required for ImageJ ROI conversion. Install with: pip install roifile")
 
         members: list[ImageJROIMember] = []
+        # One converter per shape type and one name base per ROI; the names
+        # match imagej_roi_name() for every projected shape.
+        converters: dict[ShapeType, ImageJROIShapeConverter] = {}
+        name_prefix = f"{roi_prefix}_ROI_" if roi_prefix else "ROI_"
         for roi_index, roi in enumerate(rois, start=1):
+            name_base = f"{name_prefix}{roi_index}_"
             for shape_index, shape in enumerate(roi.shapes, start=1):
-                imagej_roi = ImageJROIShapeConverter.for_shape(shape).imagej_roi(
-                    shape,
-                    FijiROIConverter.imagej_roi_name(
-                        roi_prefix=roi_prefix,
-                        roi_index=roi_index,
-                        shape_index=shape_index,
-                    ),
-                )
+                converter = converters.get(shape.shape_type)
+                if converter is None:
+                    converter = ImageJROIShapeConverter.for_shape(shape)
+                    converters[shape.shape_type] = converter
                 members.append(
                     ImageJROIMember(
-                        imagej_roi=imagej_roi,
+                        imagej_roi=converter.imagej_roi(
+                            shape,
+                            f"{name_base}{shape_index}",
+                        ),
                         metadata=dict(roi.metadata),
                     )
                 )
@@ -664,16 +671,26 @@ class FijiROIConverter:
             )
         ]
 
+    @staticmethod
+    def rois_to_transmission(rois: List[ROI], roi_prefix: str = "") -> List[str]:
+        """Convert ROI objects straight to base64 ImageJ ROI strings in one pass."""
+        b64encode = base64.b64encode
+        return [
+            b64encode(member.imagej_roi.tobytes()).decode("ascii")
+            for member in FijiROIConverter.rois_to_imagej_members(
+                rois,
+                roi_prefix=roi_prefix,
+            )
+        ]
+
     @staticmethod
     def encode_rois_for_transmission(roi_bytes_list: List[bytes]) -> List[str]:
         """Base64 encode ROI bytes for JSON transmission."""
-        import base64
         return [base64.b64encode(roi_bytes).decode("utf-8") for roi_bytes in roi_bytes_list]
 
     @staticmethod
     def decode_rois_from_transmission(encoded_rois: List[str]) -> List[bytes]:
         """Decode base64-encoded ROI bytes."""
-        import base64
         return [base64.b64decode(roi_encoded) for roi_encoded in encoded_rois]
 
     @staticmethod
@@ -23,6 +23,7 @@ from polystore.streaming._streaming_backend import (
     StreamingItemPreparationRequest,
     StreamingPreparedBatchItems,
     StreamingSharedMemoryAuthority,
+    StreamingWireCodec,
     ViewerDisplayPayloadExtra,
 )
 
@@ -39,5 +40,6 @@ __all__ = [
     "StreamingComponentNamesRequest",
     "StreamingItemPreparationRequest",
     "StreamingSharedMemoryAuthority",
+    "StreamingWireCodec",
     "ViewerDisplayPayloadExtra",
 ]
@@ -7,10 +7,17 @@ data to external systems without persistent storage capabilities.
 
 from __future__ import annotations
 
+import ctypes
+import itertools
+import json
 import logging
+import os
+import queue
+import threading
 import time
-import uuid
-from collections.abc import Mapping, Sequence
+import weakref
+from collections.abc import Callable, Mapping, Sequence
+from collections import defaultdict, deque
 from dataclasses import dataclass, field
 from multiprocessing import resource_tracker, shared_memory
 from multiprocessing.shared_memory import _USE_POSIX
@@ -34,12 +41,15 @@ from .viewer_transport import (
     ViewerStreamBatchItemSource,
     ViewerStreamBackendKwargs,
     ViewerStreamItemPayload,
+    ViewerSocketProfile,
     ViewerStreamRequest,
     ViewerTransportDefaults,
 )
 from zmqruntime.ack_listener import GlobalAckListener
 from zmqruntime.config import ZMQConfig
+from zmqruntime.queue_tracker import GlobalQueueTrackerRegistry
 from zmqruntime.viewer_protocol import (
+    ViewerAckPolicy,
     ViewerBatchItemWireField,
     ViewerBatchMessagePayload,
     ViewerComponentMetadataPayload,
@@ -50,6 +60,14 @@ from zmqruntime.viewer_protocol import (
     ViewerWireValue,
 )
 
+# Optional fast JSON encoder for the viewer wire format
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 
@@ -290,18 +308,208 @@ class StreamingSharedMemoryName:
         cls,
         shm_prefix: str,
     ) -> "StreamingSharedMemoryName":
-        return cls(f"{shm_prefix}{uuid.uuid4().hex[:12]}")
+        return cls(f"{shm_prefix}{StreamingImageIdAuthority.next_token()}")
+
+
+class StreamingImageIdAuthority:
+    """Allocate process-unique image ids for queue tracking and viewer acks.
+
+    Ids are a per-process session prefix plus a shared monotonic counter, so
+    every backend in the process draws from one sequence and never collides
+    in the tracker. The session mixes the pid with random bytes drawn once,
+    so a recycled pid does not repeat an earlier process's ids.
+    """
+
+    _counter = itertools.count()
+    _session_pid: int | None = None
+    _session = ""
+    _token_prefix = ""
+
+    @classmethod
+    def _refresh_session(cls) -> None:
+        pid = os.getpid()
+        if pid != cls._session_pid:
+            token = os.urandom(4).hex()
+            cls._session = f"{pid:x}-{token}-"
+            cls._token_prefix = f"{token}_"
+            cls._session_pid = pid
+
+    @classmethod
+    def allocate(cls, count: int) -> list[str]:
+        cls._refresh_session()
+        prefix = cls._session
+        counter = cls._counter
+        return [f"{prefix}{next(counter):x}" for _ in range(count)]
+
+    @classmethod
+    def next_token(cls) -> str:
+        """Return a short session-unique token for shared-memory names."""
+        cls._refresh_session()
+        return f"{cls._token_prefix}{next(cls._counter):x}"
+
+
+class StreamingSharedMemoryPool:
+    """Sender-side free list of shared-memory blocks keyed by size bucket.
+
+    Blocks are returned to the pool only after the viewer acknowledged the
+    batch, i.e. after the receiver copied every payload into its own memory,
+    so reusing a block name cannot race a pending receiver read. The most
+    recently released block is reused first because its pages are still
+    resident; blocks left idle longer than ``idle_ttl_seconds`` are unlinked
+    so a burst does not pin its peak footprint for the process lifetime.
+
+    Reuse is only sound against receivers that leave unlinking to the sender.
+    A pooled block whose name a receiver already unlinked is dropped on
+    acquire instead of being handed out again, but a receiver that unlinks
+    after acknowledging can still race the next batch, so pooling is opt-in.
+    With ``max_pool_bytes == 0`` every released block is unlinked at once.
+    """
+
+    MIN_BUCKET_BYTES: int = 4096
+
+    def __init__(
+        self,
+        max_pool_bytes: int,
+        idle_ttl_seconds: float | None = None,
+    ) -> None:
+        self._max_pool_bytes = max_pool_bytes
+        self._idle_ttl_seconds = idle_ttl_seconds
+        self._free: defaultdict[
+            int, deque[tuple[float, shared_memory.SharedMemory]]
+        ] = defaultdict(deque)
+        self._pooled_bytes = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def bucket_size(cls, nbytes: int) -> int:
+        if nbytes <= cls.MIN_BUCKET_BYTES:
+            return cls.MIN_BUCKET_BYTES
+        return 1 << (nbytes - 1).bit_length()
+
+    @property
+    def pooled_bytes(self) -> int:
+        return self._pooled_bytes
+
+    def acquire(self, nbytes: int, shm_prefix: str) -> shared_memory.SharedMemory:
+        bucket = self.bucket_size(nbytes)
+        while True:
+            with self._lock:
+                free_blocks = self._free.get(bucket)
+                if not free_blocks:
+                    break
+                self._pooled_bytes -= bucket
+                shm = free_blocks.pop()[1]
+            if self._is_linked(shm):
+                return shm
+            # A receiver unlinked this name; drop the orphaned mapping.
+            shm.close()
+        return shared_memory.SharedMemory(
+            create=True,
+            size=bucket,
+            name=StreamingSharedMemoryName.unique(shm_prefix).value,
+        )
+
+    def release(self, shm: shared_memory.SharedMemory) -> None:
+        now = time.monotonic()
+        with self._lock:
+            expired = self._pop_idle_locked(now)
+            if self._pooled_bytes + shm.size <= self._max_pool_bytes:
+                self._free[shm.size].append((now, shm))
+                self._pooled_bytes += shm.size
+            else:
+                expired.append(shm)
+        self._unlink(expired)
+
+    def _pop_idle_locked(self, now: float) -> list[shared_memory.SharedMemory]:
+        if self._idle_ttl_seconds is None:
+            return []
+        deadline = now - self._idle_ttl_seconds
+        expired = []
+        for free_blocks in self._free.values():
+            while free_blocks and free_blocks[0][0] < deadline:
+                shm = free_blocks.popleft()[1]
+                self._pooled_bytes -= shm.size
+                expired.append(shm)
+        return expired
+
+    def clear(self) -> None:
+        with self._lock:
+            blocks = [
+                shm for free_blocks in self._free.values() for _, shm in free_blocks
+            ]
+            self._free.clear()
+            self._pooled_bytes = 0
+        self._unlink(blocks)
+
+    @staticmethod
+    def _is_linked(shm: shared_memory.SharedMemory) -> bool:
+        """Return whether a pooled block's name still resolves to a segment."""
+        # The pool created this block, so the probe's tracker registration
+        # repeats the creator's and must not be unregistered here.
+        try:
+            probe = shared_memory.SharedMemory(name=shm.name)
+        except FileNotFoundError:
+            return False
+        probe.close()
+        return True
+
+    @staticmethod
+    def _unlink(blocks: Sequence[shared_memory.SharedMemory]) -> None:
+        for shm in blocks:
+            try:
+                shm.close()
+                shm.unlink()
+            except FileNotFoundError:
+                # The receiver already unlinked this block after copying it.
+                pass
+            except Exception as e:
+                logger.warning("Failed to release pooled shared memory %s: %s", shm.name, e)
+
+
+@dataclass(frozen=True)
+class StreamingHostLayout:
+    """Host shape and dtype of a payload that has not been copied to host."""
+
+    shape: tuple[int, ...]
+    dtype: np.dtype
+
+
+StreamingHostCopy: TypeAlias = Callable[[StreamablePayload, np.ndarray], None]
+
+
+def _copy_cupy_to_host(data, out: np.ndarray) -> None:
+    data.get(out=out)
+
+
+def _copy_torch_to_host(data, out: np.ndarray) -> None:
+    import torch
+
+    torch.from_numpy(out).copy_(data.detach())
 
 
 class StreamingPayloadMemoryAuthority:
     """Memory conversion authority for streamable image payloads."""
 
-    @staticmethod
-    def to_numpy(data: StreamablePayload) -> np.ndarray:
+    # Device arrays copied straight into a caller-provided host buffer, so the
+    # shared-memory block is the only host allocation
+    DIRECT_HOST_COPIES: Mapping[str, StreamingHostCopy] = MappingProxyType({
+        ArrayBridgeMemoryType.CUPY.value: _copy_cupy_to_host,
+        ArrayBridgeMemoryType.TORCH.value: _copy_torch_to_host,
+    })
+    DLPACK_CPU_DEVICE: int = 1
+
+    @classmethod
+    def to_numpy(cls, data: StreamablePayload) -> np.ndarray:
         if isinstance(data, np.ndarray):
             return data
         if isinstance(data, (list, tuple)):
             return np.asarray(data)
+        if hasattr(data, "__array_interface__"):
+            # Host buffers exporting the array interface are viewed in place
+            return np.asarray(data)
+        if cls._is_dlpack_host_array(data):
+            # Host-resident foreign arrays are viewed without a copy
+            return np.from_dlpack(data)
         return convert_memory(
             data,
             detect_memory_type(data),
@@ -309,6 +517,35 @@ class StreamingPayloadMemoryAuthority:
             gpu_id=0,
         )
 
+    @classmethod
+    def _is_dlpack_host_array(cls, data: StreamablePayload) -> bool:
+        dlpack_device = getattr(data, "__dlpack_device__", None)
+        if dlpack_device is None or getattr(data, "__dlpack__", None) is None:
+            return False
+        return dlpack_device()[0] == cls.DLPACK_CPU_DEVICE
+
+    @classmethod
+    def direct_host_copy(cls, data: StreamablePayload) -> StreamingHostCopy | None:
+        """Return the copy function for device arrays that can fill host memory."""
+        if isinstance(data, (np.ndarray, list, tuple)) or cls._is_dlpack_host_array(data):
+            return None
+        try:
+            return cls.DIRECT_HOST_COPIES.get(detect_memory_type(data))
+        except ValueError:
+            return None
+
+    @staticmethod
+    def host_layout(data: StreamablePayload) -> StreamingHostLayout | None:
+        """Return the host layout of a device array, if its dtype maps to numpy."""
+        try:
+            dtype = np.dtype(str(data.dtype).removeprefix("torch."))
+        except TypeError:
+            return None
+        return StreamingHostLayout(
+            shape=tuple(int(dimension) for dimension in data.shape),
+            dtype=dtype,
+        )
+
 
 class StreamingSharedMemoryAuthority:
     """Own sender allocation and receiver attachment for shared-memory streams."""
@@ -335,21 +572,58 @@ class StreamingSharedMemoryAuthority:
         finally:
             memory.close()
 
+    @staticmethod
+    def _allocate(
+        nbytes: int,
+        shm_prefix: str,
+        pool: StreamingSharedMemoryPool | None,
+    ) -> shared_memory.SharedMemory:
+        if pool is None:
+            return shared_memory.SharedMemory(
+                create=True,
+                size=nbytes,
+                name=StreamingSharedMemoryName.unique(shm_prefix).value,
+            )
+        return pool.acquire(nbytes, shm_prefix)
+
+    @classmethod
+    def allocate_array(
+        cls,
+        shape: Sequence[int],
+        dtype: str | np.dtype,
+        shm_prefix: str,
+        pool: StreamingSharedMemoryPool | None = None,
+    ) -> tuple[np.ndarray, shared_memory.SharedMemory]:
+        """Allocate an empty array whose pixels live in a sender-owned block."""
+        dtype = np.dtype(dtype)
+        nbytes = int(np.prod(shape, dtype=np.int64)) * dtype.itemsize
+        shm = cls._allocate(nbytes, shm_prefix, pool)
+        # numpy drops a memoryview's export and keeps only the mmap, which
+        # close() would then unmap under the array. A ctypes view holds the
+        # export for the array's lifetime, so close() raises BufferError.
+        pinned = (ctypes.c_char * nbytes).from_buffer(shm.buf)
+        return np.ndarray(tuple(shape), dtype=dtype, buffer=pinned), shm
+
     @classmethod
     def create(
         cls,
         request: StreamingSharedMemoryRequest,
+        pool: StreamingSharedMemoryPool | None = None,
+        allocated: shared_memory.SharedMemory | None = None,
     ) -> StreamingSharedMemoryBlock:
-        np_data = StreamingPayloadMemoryAuthority.to_numpy(request.data)
-        shm_name = StreamingSharedMemoryName.unique(request.shm_prefix).value
-        shm = shared_memory.SharedMemory(
-            create=True,
-            size=np_data.nbytes,
-            name=shm_name,
-        )
+        """Publish a payload through shared memory.
 
-        shm_array = np.ndarray(np_data.shape, dtype=np_data.dtype, buffer=shm.buf)
-        shm_array[:] = np_data[:]
+        ``allocated`` is the block that already backs ``request.data`` (see
+        ``allocate_array``); the payload is then published without a copy.
+        """
+        np_data = StreamingPayloadMemoryAuthority.to_numpy(request.data)
+        if allocated is None:
+            shm = cls._allocate(np_data.nbytes, request.shm_prefix, pool)
+            shm_array = np.ndarray(np_data.shape, dtype=np_data.dtype, buffer=shm.buf)
+            np.copyto(shm_array, np_data, casting="no")
+        else:
+            shm = allocated
+        shm_name = shm.name
 
         return StreamingSharedMemoryBlock(
             shared_memory=shm,
@@ -397,7 +671,7 @@ class StreamingComponentNamesMetadataCollector:
                 component_name,
             )
             if request.verbose and request.log_prefix:
-                logger.info(
+                logger.debug(
                     "%s: Got %s metadata: %s",
                     request.log_prefix,
                     component_name,
@@ -430,39 +704,42 @@ class StreamingBatchItemPreparationAuthority:
         backend: "StreamingBackend",
         request: StreamingBatchMessageRequest,
     ) -> StreamingPreparedBatchItems:
-        batch_images = []
-        image_ids = []
-
-        for index, (data, file_path) in enumerate(
-            zip(request.data_list, request.file_paths)
+        item_count = len(request.file_paths)
+        batch_images: list[dict[str, ViewerWireValue]] = []
+        add_batch_image = batch_images.append
+        image_ids = StreamingImageIdAuthority.allocate(item_count)
+
+        # Loop invariants are bound once; the per-item body only prepares data.
+        stream_source = request.stream_request.source
+        batch_item_payload = request.stream_request.producer.batch_item_payload
+        prepare_batch_item = backend._prepare_batch_item
+        detect_data_type = StreamingDataTypeAuthority.detect
+
+        for index, (data, file_path, image_id) in enumerate(
+            zip(request.data_list, request.file_paths, image_ids)
         ):
             item_path = StreamingItemPath(file_path)
-            image_id = str(uuid.uuid4())
-            image_ids.append(image_id)
-
-            streaming_data_type = StreamingDataTypeAuthority.detect(data)
-            item_payload = backend._prepare_batch_item(
+            item_payload = prepare_batch_item(
                 StreamingItemPreparationRequest(
                     data=data,
                     item_path=item_path,
-                    streaming_data_type=streaming_data_type,
+                    streaming_data_type=detect_data_type(data),
                 )
             )
 
-            batch_images.append(
-                request.stream_request.producer.batch_item_payload(
-                    ViewerStreamBatchItemSource.from_input(
-                        ViewerStreamBatchItemInput(
-                            stream_source=request.stream_request.source,
-                            item_payload=item_payload.item_payload,
-                            streaming_data_type=item_payload.streaming_data_type,
-                            file_path=item_path.value,
-                            index=index,
-                            image_id=image_id,
-                        )
+            batch_image = batch_item_payload(
+                ViewerStreamBatchItemSource.from_input(
+                    ViewerStreamBatchItemInput(
+                        stream_source=stream_source,
+                        item_payload=item_payload.item_payload,
+                        streaming_data_type=item_payload.streaming_data_type,
+                        file_path=item_path.value,
+                        index=index,
+                        image_id=image_id,
                     )
-                ).to_wire_mapping()
-            )
+                )
+            ).to_wire_mapping()
+            add_batch_image(batch_image)
 
         return StreamingPreparedBatchItems(
             batch_images=batch_images,
@@ -545,6 +822,46 @@ class StreamingBatchMessageBuilder:
         )
 
 
+class StreamingWireCodec:
+    """Own the byte encoding of viewer batch messages on the data socket.
+
+    Messages stay JSON so existing viewer receivers keep decoding them with
+    ``json.loads``; the sender encodes once into compact UTF-8 bytes and
+    hands them to the socket as a single frame. ``orjson`` is used when it
+    is installed and the standard library encoder otherwise.
+    """
+
+    SEPARATORS: tuple[str, str] = (",", ":")
+
+    @classmethod
+    def encode(cls, message: Mapping[str, ViewerWireValue]) -> bytes:
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(
+                message,
+                option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+            )
+        return json.dumps(
+            message,
+            separators=cls.SEPARATORS,
+            ensure_ascii=False,
+        ).encode("utf-8")
+
+    @staticmethod
+    def decode(frame: bytes | bytearray | memoryview) -> dict[str, ViewerWireValue]:
+        if ORJSON_AVAILABLE:
+            return orjson.loads(frame)
+        return json.loads(bytes(frame))
+
+
+class _ViewerThreadSockets:
+    """Marks one thread's viewer sockets; collected when that thread exits."""
+
+    __slots__ = ("token", "__weakref__")
+
+    def __init__(self, token: int) -> None:
+        self.token = token
+
+
 class StreamingBackend(DataSink):
     """
     Abstract base class for ZeroMQ-based streaming backends.
@@ -566,6 +883,21 @@ class StreamingBackend(DataSink):
     VIEWER_TYPE: str
     SHM_PREFIX: str
 
+    # Upper bound on acknowledged shared memory kept for reuse across batches;
+    # 0 unlinks every block after its ack. Enable only for receivers that
+    # never unlink sender memory (see StreamingSharedMemoryPool).
+    SHM_POOL_MAX_BYTES: int = 0
+    # Pooled blocks idle for longer than this are unlinked; None keeps them
+    SHM_POOL_IDLE_SECONDS: float | None = 60.0
+
+    # Data socket tuning; None uses the shared transport default profile
+    SOCKET_PROFILE: ViewerSocketProfile | None = None
+
+    # Send batches from one writer thread so save_batch returns once the
+    # batch is prepared; a failed send is raised by the next save_batch or
+    # cleanup call
+    BACKGROUND_SEND: bool = False
+
     # Class attribute: streaming backends only support image array data and ROIs
     supports_arbitrary_files: bool = False
 
@@ -600,12 +932,17 @@ class StreamingBackend(DataSink):
         Returns:
             Tuple of (filtered_data, filtered_paths, skipped_paths)
         """
+        supported = [self.supports_file_path(path) for path in file_paths]
+        if all(supported):
+            # Common case: the whole batch streams, so no per-item filtering
+            return list(data_list), list(file_paths), []
+
         filtered_data = []
         filtered_paths = []
         skipped_paths = []
 
-        for data, path in zip(data_list, file_paths):
-            if self.supports_file_path(path):
+        for data, path, is_supported in zip(data_list, file_paths, supported):
+            if is_supported:
                 filtered_data.append(data)
                 filtered_paths.append(path)
             else:
@@ -613,30 +950,133 @@ class StreamingBackend(DataSink):
 
         if skipped_paths:
             logger.info(
-                f"{self.VIEWER_TYPE}: Skipping {len(skipped_paths)} non-streamable files: "
-                f"{[str(p) for p in skipped_paths]}"
+                "%s: Skipping %d non-streamable files: %s",
+                self.VIEWER_TYPE,
+                len(skipped_paths),
+                [str(p) for p in skipped_paths],
             )
 
         return filtered_data, filtered_paths, skipped_paths
 
     def __init__(self, transport_config: ZMQConfig = POLYSTORE_ZMQ_CONFIG):
         """Initialize ZeroMQ and shared memory infrastructure."""
-        self._publishers = {}
+        self._publishers: dict[tuple[int, str], zmq.Socket] = {}
+        self._publishers_lock = threading.Lock()
+        self._thread_sockets = threading.local()
+        self._thread_socket_tokens = itertools.count()
         self._context = None
         self._shared_memory_blocks = {}
+        self._shm_pool = StreamingSharedMemoryPool(
+            self.SHM_POOL_MAX_BYTES,
+            self.SHM_POOL_IDLE_SECONDS,
+        )
+        # Blocks handed out by allocate_shared_array, keyed by buffer address
+        self._allocated_blocks: dict[int, shared_memory.SharedMemory] = {}
+        self._allocated_blocks_lock = threading.Lock()
+        # Streamed allocated blocks are unlinked, never pooled, since the
+        # producer may still hold their arrays; handles whose arrays are still
+        # alive wait here until they can be closed
+        self._adopted_block_names: set[str] = set()
+        self._exported_blocks: list[shared_memory.SharedMemory] = []
+        self._sender_queue: queue.SimpleQueue | None = None
+        self._sender_thread: threading.Thread | None = None
+        self._sender_error: Exception | None = None
         self._transport_config = transport_config
 
+    def allocate_shared_array(
+        self,
+        shape: Sequence[int],
+        dtype: str | np.dtype,
+    ) -> np.ndarray:
+        """Return an empty array backed by this backend's shared memory.
+
+        Producers that fill the returned array in place and then stream it
+        skip the copy into shared memory. Streaming the array hands its block
+        back to the backend, which unlinks it once the viewer acknowledges the
+        batch; the block is never pooled, so the array keeps its own pixels
+        for as long as the producer holds it.
+        """
+        array, shm = StreamingSharedMemoryAuthority.allocate_array(
+            shape,
+            dtype,
+            self.SHM_PREFIX,
+            self._shm_pool,
+        )
+        with self._allocated_blocks_lock:
+            self._allocated_blocks[array.__array_interface__["data"][0]] = shm
+        return array
+
+    def _take_allocated_block(
+        self,
+        np_data: np.ndarray,
+    ) -> shared_memory.SharedMemory | None:
+        if not self._allocated_blocks or not np_data.flags.c_contiguous:
+            return None
+        with self._allocated_blocks_lock:
+            return self._allocated_blocks.pop(
+                np_data.__array_interface__["data"][0],
+                None,
+            )
+
     def create_shared_memory_payload(
         self,
         data: StreamablePayload,
         file_path: FilePath,
     ) -> dict[str, ViewerWireValue]:
+        host_copy = StreamingPayloadMemoryAuthority.direct_host_copy(data)
+        if host_copy is not None:
+            layout = StreamingPayloadMemoryAuthority.host_layout(data)
+            if layout is not None:
+                return self._device_shared_memory_payload(
+                    data,
+                    layout,
+                    host_copy,
+                    file_path,
+                )
+        np_data = StreamingPayloadMemoryAuthority.to_numpy(data)
+        allocated = self._take_allocated_block(np_data)
         block = StreamingSharedMemoryAuthority.create(
             StreamingSharedMemoryRequest(
-                data=data,
+                data=np_data,
                 item_path=StreamingItemPath(file_path),
                 shm_prefix=self.SHM_PREFIX,
-            )
+            ),
+            self._shm_pool,
+            allocated,
+        )
+        if allocated is not None:
+            with self._allocated_blocks_lock:
+                self._adopted_block_names.add(block.payload.shm_name)
+        self._shared_memory_blocks[block.payload.shm_name] = block.shared_memory
+        return block.payload.to_wire_mapping()
+
+    def _device_shared_memory_payload(
+        self,
+        data: StreamablePayload,
+        layout: StreamingHostLayout,
+        host_copy: StreamingHostCopy,
+        file_path: FilePath,
+    ) -> dict[str, ViewerWireValue]:
+        """Copy a device array straight into shared memory in one transfer."""
+        host_array, shm = StreamingSharedMemoryAuthority.allocate_array(
+            layout.shape,
+            layout.dtype,
+            self.SHM_PREFIX,
+            self._shm_pool,
+        )
+        try:
+            host_copy(data, host_array)
+        except BaseException:
+            del host_array
+            self._shm_pool.release(shm)
+            raise
+        block = StreamingSharedMemoryAuthority.create(
+            StreamingSharedMemoryRequest(
+                data=host_array,
+                item_path=StreamingItemPath(file_path),
+                shm_prefix=self.SHM_PREFIX,
+            ),
+            allocated=shm,
         )
         self._shared_memory_blocks[block.payload.shm_name] = block.shared_memory
         return block.payload.to_wire_mapping()
@@ -661,27 +1101,86 @@ class StreamingBackend(DataSink):
             config=transport_config,
         )
 
-        from zmqruntime.queue_tracker import GlobalQueueTrackerRegistry
         registry = GlobalQueueTrackerRegistry()
         tracker = registry.get_or_create_tracker(
             transport_endpoint.port,
             self.VIEWER_TYPE,
         )
+        # Trackers exposing a batch registration take their lock once per batch.
+        register_sent_batch = getattr(tracker, "register_sent_batch", None)
+        if register_sent_batch is not None:
+            register_sent_batch(image_ids)
+            return
+        register_sent = tracker.register_sent
         for image_id in image_ids:
-            tracker.register_sent(image_id)
+            register_sent(image_id)
 
     def _cleanup_shared_memory_blocks(self, batch_images, unlink: bool = False) -> None:
+        blocks = self._shared_memory_blocks
+        shm_name_field = ViewerBatchItemWireField.SHM_NAME.value
         for img in batch_images:
-            shm_name = img.get(ViewerBatchItemWireField.SHM_NAME.value)
-            if shm_name and shm_name in self._shared_memory_blocks:
+            shm_name = img.get(shm_name_field)
+            if shm_name and shm_name in blocks:
+                if self._release_adopted_block(shm_name, blocks):
+                    continue
                 try:
-                    shm = self._shared_memory_blocks.pop(shm_name)
+                    shm = blocks.pop(shm_name)
                     shm.close()
                     if unlink:
                         shm.unlink()
                 except Exception as e:
                     logger.warning(f"Failed to cleanup shared memory {shm_name}: {e}")
 
+    def _recycle_shared_memory_blocks(self, batch_images) -> None:
+        """Return acknowledged shared-memory blocks to the sender pool."""
+        blocks = self._shared_memory_blocks
+        release = self._shm_pool.release
+        shm_name_field = ViewerBatchItemWireField.SHM_NAME.value
+        for img in batch_images:
+            shm_name = img.get(shm_name_field)
+            if shm_name and shm_name in blocks:
+                if self._release_adopted_block(shm_name, blocks):
+                    continue
+                try:
+                    release(blocks.pop(shm_name))
+                except Exception as e:
+                    logger.warning("Failed to recycle shared memory %s: %s", shm_name, e)
+
+    def _release_adopted_block(
+        self,
+        shm_name: str,
+        blocks: dict[str, shared_memory.SharedMemory],
+    ) -> bool:
+        """Unlink a streamed allocate_shared_array block instead of pooling it."""
+        with self._allocated_blocks_lock:
+            if shm_name not in self._adopted_block_names:
+                return False
+            self._adopted_block_names.discard(shm_name)
+        shm = blocks.pop(shm_name)
+        try:
+            shm.unlink()
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning("Failed to unlink allocated shared memory %s: %s", shm_name, e)
+        with self._allocated_blocks_lock:
+            self._exported_blocks.append(shm)
+            self._exported_blocks = self._close_exported_blocks(self._exported_blocks)
+        return True
+
+    @staticmethod
+    def _close_exported_blocks(
+        exported_blocks: Sequence[shared_memory.SharedMemory],
+    ) -> list[shared_memory.SharedMemory]:
+        """Close unlinked blocks; return those whose arrays are still alive."""
+        still_exported = []
+        for shm in exported_blocks:
+            try:
+                shm.close()
+            except BufferError:
+                still_exported.append(shm)
+        return still_exported
+
     def _prepare_batch_item(
         self,
         request: StreamingItemPreparationRequest,
@@ -751,16 +1250,25 @@ class StreamingBackend(DataSink):
         )
         url = transport_endpoint.data_url(transport_config)
 
-        if self._context is None:
-            self._context = zmq.Context()
+        if self.BACKGROUND_SEND:
+            self._raise_sender_error()
+            # Shared-memory blocks already hold a snapshot of the
+            # pixels, so the caller may reuse its arrays once this returns.
+            self._send_queue().put((transport_endpoint, url, built_batch))
+            return
+        self._send_built_batch(transport_endpoint, url, built_batch)
 
+    def _send_built_batch(
+        self,
+        transport_endpoint: ViewerTransportEndpoint,
+        url: str,
+        built_batch: StreamingBuiltBatch,
+    ) -> None:
+        """Send one built batch and wait for the viewer's acknowledgement."""
         viewer_name = str(self.VIEWER_TYPE).title()
         viewer_label = viewer_name.upper()
         ack_policy = STREAMING_TRANSPORT_DEFAULTS.ack_policy(viewer_name)
-        socket = self._context.socket(zmq.REQ)
-        ack_policy.apply_socket_options(socket)
-        socket.connect(url)
-        time.sleep(0.1)
+        socket_key, socket = self._get_viewer_socket(url, ack_policy)
 
         try:
             logger.info(
@@ -771,7 +1279,10 @@ class StreamingBackend(DataSink):
                 viewer_name,
                 transport_endpoint.port,
             )
-            socket.send_json(built_batch.message)
+            # Zero-copy hands the encoded frame to libzmq; pyzmq still copies
+            # frames below zmq.COPY_THRESHOLD where that is cheaper.
+            frame = StreamingWireCodec.encode(built_batch.message)
+            socket.send(frame, copy=False, track=False)
             ack_response = ack_policy.receive(
                 socket,
                 lambda: self._cleanup_shared_memory_blocks(
@@ -786,13 +1297,131 @@ class StreamingBackend(DataSink):
                 viewer_name,
                 ack_policy.status(ack_response),
             )
-        finally:
-            socket.close()
+        except BaseException:
+            # A REQ socket without a matched reply cannot send again, and a
+            # send that never reached the viewer leaves its blocks unowned.
+            self._discard_viewer_socket(socket_key)
+            self._cleanup_shared_memory_blocks(built_batch.batch_images, unlink=True)
+            raise
 
         # A successful REP certifies that the viewer copied every shared-memory
         # payload into receiver-owned memory. The sender remains the allocation
-        # owner and releases each block only after that transfer boundary.
-        self._cleanup_shared_memory_blocks(built_batch.batch_images, unlink=True)
+        # owner and recycles each block only after that transfer boundary.
+        self._recycle_shared_memory_blocks(built_batch.batch_images)
+
+    def _get_viewer_socket(
+        self,
+        url: str,
+        ack_policy: ViewerAckPolicy,
+    ) -> tuple[tuple[int, str], zmq.Socket]:
+        """Return this thread's connected REQ socket for a viewer data URL.
+
+        REQ sockets are reusable after each matched reply but not across
+        threads, so sockets are kept per (thread token, url). Tokens are never
+        reused, unlike thread idents, and a thread's sockets are closed when
+        it exits or on cleanup().
+        """
+        key = (self._thread_socket_token(), url)
+        socket = self._publishers.get(key)
+        if socket is not None:
+            return key, socket
+        with self._publishers_lock:
+            if self._context is None:
+                self._context = zmq.Context()
+            socket = self._context.socket(zmq.REQ)
+            ack_policy.apply_socket_options(socket)
+            STREAMING_TRANSPORT_DEFAULTS.apply_socket_options(socket, self.SOCKET_PROFILE)
+            socket.connect(url)
+            self._publishers[key] = socket
+        # REQ/REP has no slow-joiner window: the first send queues until the
+        # connection completes, so no settle delay is needed after connect.
+        return key, socket
+
+    def _thread_socket_token(self) -> int:
+        thread_sockets = getattr(self._thread_sockets, "owner", None)
+        if thread_sockets is None:
+            thread_sockets = _ViewerThreadSockets(next(self._thread_socket_tokens))
+            self._thread_sockets.owner = thread_sockets
+            # Thread-local values are released when their thread exits
+            weakref.finalize(
+                thread_sockets,
+                self._close_thread_sockets,
+                self._publishers,
+                self._publishers_lock,
+                thread_sockets.token,
+            )
+        return thread_sockets.token
+
+    @staticmethod
+    def _close_thread_sockets(
+        publishers: dict[tuple[int, str], zmq.Socket],
+        publishers_lock: threading.Lock,
+        token: int,
+    ) -> None:
+        with publishers_lock:
+            sockets = [
+                publishers.pop(key) for key in list(publishers) if key[0] == token
+            ]
+        for socket in sockets:
+            socket.close()
+
+    def _send_queue(self) -> queue.SimpleQueue:
+        """Return the background sender queue, starting its writer thread."""
+        with self._publishers_lock:
+            if self._sender_thread is None:
+                self._sender_queue = queue.SimpleQueue()
+                self._sender_thread = threading.Thread(
+                    target=self._drain_send_queue,
+                    args=(self._sender_queue,),
+                    name=f"polystore-{self.VIEWER_TYPE}-sender",
+                    daemon=True,
+                )
+                self._sender_thread.start()
+            return self._sender_queue
+
+    def _drain_send_queue(self, send_queue: queue.SimpleQueue) -> None:
+        # The writer thread is the only user of its sockets; _get_viewer_socket
+        # keys them by thread, so they never cross into caller threads.
+        while True:
+            queued_batch = send_queue.get()
+            if queued_batch is None:
+                return
+            try:
+                self._send_built_batch(*queued_batch)
+            except Exception as e:
+                logger.error(
+                    "%s background send failed: %s",
+                    self.VIEWER_TYPE,
+                    e,
+                    exc_info=True,
+                )
+                with self._publishers_lock:
+                    if self._sender_error is None:
+                        self._sender_error = e
+
+    def _raise_sender_error(self) -> None:
+        """Raise the first background send failure not yet seen by a caller."""
+        with self._publishers_lock:
+            error, self._sender_error = self._sender_error, None
+        if error is not None:
+            raise error
+
+    def _stop_sender_thread(self) -> None:
+        with self._publishers_lock:
+            thread, send_queue = self._sender_thread, self._sender_queue
+            self._sender_thread = self._sender_queue = None
+        if thread is None:
+            return
+        send_queue.put(None)
+        # Every queued send is bounded by the ack timeout, and the sockets and
+        # blocks it uses must outlive it, so wait for the queue to drain.
+        thread.join()
+
+    def _discard_viewer_socket(self, key: tuple[int, str]) -> None:
+        with self._publishers_lock:
+            socket = self._publishers.pop(key, None)
+        if socket is not None:
+            socket.close()
 
     def save(self, data: StreamablePayload | str, file_path: FilePath, **kwargs) -> None:
         """
@@ -812,9 +1441,14 @@ class StreamingBackend(DataSink):
         Clean up shared memory and ZeroMQ resources (common for all streaming backends).
         """
         logger.info(f"🔥 CLEANUP: Starting cleanup for {self.VIEWER_TYPE}")
+        self._stop_sender_thread()
 
         # Clean up shared memory blocks
         logger.info(f"🔥 CLEANUP: About to clean {len(self._shared_memory_blocks)} shared memory blocks")
+        with self._allocated_blocks_lock:
+            adopted_block_names = list(self._adopted_block_names)
+        for shm_name in adopted_block_names:
+            self._release_adopted_block(shm_name, self._shared_memory_blocks)
         for shm_name, shm in self._shared_memory_blocks.items():
             try:
                 shm.close()
@@ -822,18 +1456,33 @@ class StreamingBackend(DataSink):
             except Exception as e:
                 logger.warning(f"Failed to cleanup shared memory {shm_name}: {e}")
         self._shared_memory_blocks.clear()
+        with self._allocated_blocks_lock:
+            allocated_blocks = list(self._allocated_blocks.values())
+            self._allocated_blocks.clear()
+        for shm in allocated_blocks:
+            try:
+                shm.unlink()
+            except Exception as e:
+                logger.warning("Failed to cleanup allocated shared memory %s: %s", shm.name, e)
+        with self._allocated_blocks_lock:
+            self._exported_blocks = self._close_exported_blocks(
+                [*self._exported_blocks, *allocated_blocks]
+            )
+        self._shm_pool.clear()
         logger.info(f"🔥 CLEANUP: Shared memory cleanup complete")
 
         # Close publishers
-        logger.info(f"🔥 CLEANUP: About to close {len(self._publishers)} publishers")
-        for key, publisher in self._publishers.items():
+        with self._publishers_lock:
+            publishers = list(self._publishers.items())
+            self._publishers.clear()
+        logger.info(f"🔥 CLEANUP: About to close {len(publishers)} publishers")
+        for key, publisher in publishers:
             try:
                 logger.info(f"🔥 CLEANUP: Closing publisher {key}")
                 publisher.close()
                 logger.info(f"🔥 CLEANUP: Publisher {key} closed")
             except Exception as e:
                 logger.warning(f"Failed to close publisher {key}: {e}")
-        self._publishers.clear()
         logger.info(f"🔥 CLEANUP: Publishers cleanup complete")
 
         # Terminate context
@@ -847,3 +1496,4 @@ class StreamingBackend(DataSink):
             self._context = None
 
         logger.info(f"🔥 CLEANUP: {self.VIEWER_TYPE} streaming backend cleaned up")
+        self._raise_sender_error()
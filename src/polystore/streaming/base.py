@@ -5,14 +5,17 @@ Provides type-safe protocols, generic data wrappers, and component accessors
 that work with arbitrary numbers of components (not hardcoded to 3).
 """
 
-from abc import ABC, abstractmethod
-from typing import TypeVar, Generic, Dict, Any, List
-from dataclasses import dataclass
+import sys
+from typing import Any, Generic, Protocol, TypeVar
+from dataclasses import dataclass, field
 
 T = TypeVar('T')
 
+# Shared stand-in for items streamed without a metadata mapping
+_EMPTY_METADATA: dict[str, Any] = {}
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class TypedData(Generic[T]):
     """
     Generic wrapper for items with metadata.
@@ -25,15 +28,14 @@ class TypedData(Generic[T]):
 
     This provides type safety while allowing arbitrary item types.
     """
-    items: List[T]
-    metadata: Dict[str, Any]
+    items: list[T]
+    metadata: dict[str, Any]
 
 
-class ComponentAccessor(ABC):
-    """ABC for component metadata access (arbitrary number of components)."""
+class ComponentAccessor(Protocol):
+    """Structural protocol for component metadata access (any number of components)."""
 
-    @abstractmethod
-    def get_by_mode(self, mode: str) -> list:
+    def get_by_mode(self, mode: str) -> tuple[str, ...]:
         """
         Get all component names that have this mode (stack/slice/window).
 
@@ -41,25 +43,23 @@ class ComponentAccessor(ABC):
             mode: One of 'stack', 'slice', 'window', 'frame', etc.
 
         Returns:
-            List of component names (not hardcoded to 3!)
+            Tuple of component names (not hardcoded to 3!)
 
         Example:
             If config has {'channel': 'stack', 'z_index': 'slice', 'well': 'window'}
-            Then get_by_mode('stack') returns ['channel']
+            Then get_by_mode('stack') returns ('channel',)
         """
-        raise NotImplementedError
+        ...
 
-    @abstractmethod
-    def get_value(self, item: Dict[str, Any], component_name: str) -> Any:
+    def get_value(self, item: dict[str, Any], component_name: str) -> Any:
         """
         Get component value for an item.
 
         Returns:
             Value or default (0) if component not in metadata.
         """
-        raise NotImplementedError
+        ...
 
-    @abstractmethod
     def collect_values(self, component_names: list) -> list[tuple]:
         """
         Collect unique values for given components across all items.
@@ -67,48 +67,43 @@ class ComponentAccessor(ABC):
         Returns:
             Sorted list of tuples for consistent indexing.
         """
-        raise NotImplementedError
+        ...
 
 
-class HandlerContext(ABC):
-    """ABC for handler context with generic component access."""
+class HandlerContext(Protocol):
+    """Structural protocol for handler context with generic component access."""
 
     @property
-    @abstractmethod
-    def server(self) -> Any:
-        raise NotImplementedError
+    def server(self) -> Any: ...
 
     @property
-    @abstractmethod
-    def window_key(self) -> str:
-        raise NotImplementedError
+    def window_key(self) -> str: ...
 
     @property
-    @abstractmethod
-    def data(self) -> "TypedData[Any]":
-        raise NotImplementedError
+    def data(self) -> "TypedData[Any]": ...
 
     @property
-    @abstractmethod
-    def display_config(self) -> Dict[str, Any]:
-        raise NotImplementedError
+    def display_config(self) -> dict[str, Any]: ...
 
     @property
-    @abstractmethod
-    def components(self) -> ComponentAccessor:
-        raise NotImplementedError
+    def components(self) -> ComponentAccessor: ...
 
     @property
-    @abstractmethod
-    def images_dir(self) -> str | None:
-        raise NotImplementedError
+    def images_dir(self) -> str | None: ...
 
+    @property
+    def group_id(self) -> int | None: ...
 
-class ItemHandler(ABC):
-    """Type-safe ABC for item handlers with automatic discovery."""
+
+class ItemHandler:
+    """
+    Plain base for item handlers with automatic discovery.
+
+    Handlers only provide static hooks, so no ABC bookkeeping is needed;
+    the stubs below raise until a concrete handler overrides them.
+    """
 
     @staticmethod
-    @abstractmethod
     def can_handle(data_type: str) -> bool:
         """
         Check if this handler can process the given data type.
@@ -122,7 +117,6 @@ class ItemHandler(ABC):
         raise NotImplementedError
 
     @staticmethod
-    @abstractmethod
     def handle(context: HandlerContext) -> None:
         """
         Process items using type-safe context object.
@@ -133,7 +127,7 @@ class ItemHandler(ABC):
         raise NotImplementedError
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GenericComponentAccessor:
     """
     Type-safe component accessor supporting arbitrary component counts.
@@ -141,17 +135,36 @@ class GenericComponentAccessor:
     Not limited to 3 dimensions - works with any number!
     """
 
-    _display_config: Dict[str, Any]
-    _items: list[Dict[str, Any]]
+    _display_config: dict[str, Any]
+    _items: list[dict[str, Any]]
+    # Component names per mode, in component order; built once per accessor
+    _modes_index: dict[str, tuple[str, ...]] = field(
+        init=False, repr=False, compare=False
+    )
 
     def __post_init__(self):
-        """Validate display config structure."""
+        """Validate display config structure and index components by mode."""
         if 'component_modes' not in self._display_config:
             raise ValueError("Display config must have 'component_modes'")
         if 'component_order' not in self._display_config:
             raise ValueError("Display config must have 'component_order'")
 
-    def get_by_mode(self, mode: str) -> list:
+        component_modes = self._display_config['component_modes']
+        modes_index: dict[str, list[str]] = {}
+        for component in self._display_config['component_order']:
+            mode = component_modes.get(component)
+            if mode is not None:
+                # Interned names let per-item metadata lookups hit on identity
+                modes_index.setdefault(sys.intern(mode), []).append(
+                    sys.intern(component)
+                )
+        object.__setattr__(
+            self,
+            '_modes_index',
+            {mode: tuple(names) for mode, names in modes_index.items()},
+        )
+
+    def get_by_mode(self, mode: str) -> tuple[str, ...]:
         """
         Get all component names that have the given mode.
 
@@ -159,18 +172,15 @@ class GenericComponentAccessor:
             mode: One of 'stack', 'slice', 'window', 'frame', etc.
 
         Returns:
-            List of component names (not hardcoded to 3!)
+            Tuple of component names (not hardcoded to 3!)
 
         Example:
             If config has {'channel': 'stack', 'z_index': 'slice', 'well': 'window'}
-            Then get_by_mode('stack') returns ['channel']
+            Then get_by_mode('stack') returns ('channel',)
         """
-        component_modes = self._display_config['component_modes']
-        component_order = self._display_config['component_order']
-
-        return [c for c in component_order if component_modes.get(c) == mode]
+        return self._modes_index.get(mode, ())
 
-    def get_value(self, item: Dict[str, Any], component_name: str) -> Any:
+    def get_value(self, item: dict[str, Any], component_name: str) -> Any:
         """
         Get component value for an item.
 
@@ -187,24 +197,37 @@ class GenericComponentAccessor:
         Returns:
             Sorted list of tuples for consistent indexing.
         """
-        values_set = set()
-        for item in self._items:
-            metadata = item.get('metadata', {})
-            value_tuple = tuple(
-                self.get_value(item, comp) for comp in component_names
-            )
-            values_set.add(value_tuple)
-
-        return sorted(values_set)
-
-
-@dataclass(frozen=True)
+        names = tuple(component_names)
+        if not names:
+            # Every item shares the single empty tuple for an unused mode
+            return [()] if self._items else []
+        if len(names) == 1:
+            name = names[0]
+            value_tuples = [
+                ((item.get('metadata') or _EMPTY_METADATA).get(name, 0),)
+                for item in self._items
+            ]
+        else:
+            value_tuples = [
+                tuple(metadata.get(n, 0) for n in names)
+                for item in self._items
+                for metadata in (item.get('metadata') or _EMPTY_METADATA,)
+            ]
+
+        if len(value_tuples) < 2:
+            return value_tuples
+        return sorted(set(value_tuples))
+
+
+@dataclass(frozen=True, slots=True)
 class SimpleHandlerContext:
     """Concrete implementation of HandlerContext protocol."""
 
     server: Any
     window_key: str
     data: 'TypedData[Any]'
-    display_config: Dict[str, Any]
+    display_config: dict[str, Any]
     components: GenericComponentAccessor
     images_dir: str | None = None
+    # ROI Manager group for window_key, when already resolved by the caller
+    group_id: int | None = None
@@ -5,13 +5,13 @@ Uses AutoRegisterMeta for automatic registration of item handlers
 with lazy loading and caching support.
 """
 
-from typing import Type, Dict
-from metaclass_registry.core import AutoRegisterMeta, RegistryConfig
-from metaclass_registry.lazy import LazyDiscoveryDict
+from typing import Type
+from metaclass_registry import LazyDiscoveryDict, RegistryConfig
+from polystore.registry import AutoRegisterMeta
 from polystore.streaming.base import ItemHandler
 
-# Handler registry dict (will be populated by AutoRegisterMeta)
-_ITEM_HANDLERS: Dict[str, Type[ItemHandler]] = {}
+# Handler registry, populated by AutoRegisterMeta and discovered lazily
+_ITEM_HANDLERS: LazyDiscoveryDict = LazyDiscoveryDict(enable_cache=True)
 
 # Configure metaclass for handler discovery
 ITEM_HANDLER_REGISTRY_CONFIG = RegistryConfig(
@@ -25,11 +25,6 @@ ITEM_HANDLER_REGISTRY_CONFIG = RegistryConfig(
     registry_name='item handler'
 )
 
-# Create lazy registry for caching
-_ITEM_HANDLERS_LAZY = LazyDiscoveryDict(enable_cache=True)
-# Point to the lazy dict (auto-populated by metaclass)
-_ITEM_HANDLERS.update(_ITEM_HANDLERS_LAZY)
-
 
 class HandlerBase(ItemHandler, metaclass=AutoRegisterMeta):
     """
@@ -43,6 +38,7 @@ class HandlerBase(ItemHandler, metaclass=AutoRegisterMeta):
             _handler_data_type = "image"
             # Auto-registered!
     """
+    __registry_config__ = ITEM_HANDLER_REGISTRY_CONFIG
     _handler_data_type: str
 
     # Optional: override for custom key extraction
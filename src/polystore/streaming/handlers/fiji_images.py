@@ -41,18 +41,24 @@ class FijiImageHandler(HandlerBase):
     def handle(context: HandlerContext) -> None:
         """Build hyperstack from accumulated images."""
         images = context.data.items
-        channel_comps = context.components.get_by_mode("channel")
-        slice_comps = context.components.get_by_mode("slice")
-        frame_comps = context.components.get_by_mode("frame")
+        components = context.components
+        get_by_mode = components.get_by_mode
+        collect_values = components.collect_values
+        channel_comps = get_by_mode("channel")
+        slice_comps = get_by_mode("slice")
+        frame_comps = get_by_mode("frame")
 
         # Collect values for each component group
-        channel_values = context.components.collect_values(channel_comps)
-        slice_values = context.components.collect_values(slice_comps)
-        frame_values = context.components.collect_values(frame_comps)
+        channel_values = collect_values(channel_comps)
+        slice_values = collect_values(slice_comps)
+        frame_values = collect_values(frame_comps)
 
         logger.info(
-            f"🔬 FIJI IMAGE HANDLER: Processing {len(images)} images: "
-            f"{len(channel_values)}C x {len(slice_values)}Z x {len(frame_values)}T"
+            "🔬 FIJI IMAGE HANDLER: Processing %d images: %dC x %dZ x %dT",
+            len(images),
+            len(channel_values),
+            len(slice_values),
+            len(frame_values),
         )
         context.server._build_single_hyperstack(
             window_key=context.window_key,
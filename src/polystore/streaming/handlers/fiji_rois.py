@@ -4,10 +4,13 @@ Fiji-specific handler for ROI data.
 Handles ImageJ ROI Manager integration with proper component positioning.
 """
 
+import functools
 import logging
 from collections.abc import Mapping, Sequence
 from dataclasses import dataclass
+from typing import Any
 
+from polystore.roi_converters import FijiROIConverter
 from polystore.streaming.handlers import HandlerBase
 from polystore.streaming.base import HandlerContext
 from zmqruntime.viewer_protocol import (
@@ -124,6 +127,68 @@ class FijiROIAxisPosition:
         return self.values.index(value_tuple) + 1
 
 
+@functools.lru_cache(maxsize=1)
+def _scyjava() -> Any:
+    import scyjava
+
+    return scyjava
+
+
+@functools.lru_cache(maxsize=1)
+def _roi_manager_class() -> Any:
+    return _scyjava().jimport("ij.plugin.frame.RoiManager")
+
+
+@functools.lru_cache(maxsize=1)
+def _array_list_class() -> Any:
+    return _scyjava().jimport("java.util.ArrayList")
+
+
+@functools.lru_cache(maxsize=1)
+def _swing_utilities() -> Any:
+    from javax.swing import SwingUtilities
+
+    return SwingUtilities
+
+
+@functools.lru_cache(maxsize=1)
+def _create_roi_manager_runnable_class() -> type:
+    """Build the EDT Runnable that constructs a RoiManager, once per process."""
+    from jpype import JImplements, JOverride
+
+    @JImplements("java.lang.Runnable")
+    class CreateRoiManagerRunnable:
+        def __init__(self, roi_manager_class):
+            self._roi_manager_class = roi_manager_class
+            self.roi_manager = None
+
+        @JOverride
+        def run(self):
+            self.roi_manager = self._roi_manager_class()
+
+    return CreateRoiManagerRunnable
+
+
+@functools.lru_cache(maxsize=1)
+def _add_rois_runnable_class() -> type:
+    """Build the EDT Runnable that adds a prepared ROI list, once per process."""
+    from jpype import JImplements, JOverride
+
+    @JImplements("java.lang.Runnable")
+    class AddRoisRunnable:
+        def __init__(self, roi_manager, rois):
+            self._roi_manager = roi_manager
+            self._rois = rois
+
+        @JOverride
+        def run(self):
+            add_roi = self._roi_manager.addRoi
+            for roi in self._rois:
+                add_roi(roi)
+
+    return AddRoisRunnable
+
+
 class FijiROIHandler(HandlerBase):
     """Handler for ImageJ ROI Manager display."""
 
@@ -138,26 +203,25 @@ class FijiROIHandler(HandlerBase):
     def handle(context: HandlerContext) -> None:
         """Add ROIs to ImageJ ROI Manager."""
         # Get or create RoiManager on EDT
-        import scyjava as sj
-        RoiManager = sj.jimport("ij.plugin.frame.RoiManager")
+        sj = _scyjava()
+        RoiManager = _roi_manager_class()
         rm = RoiManager.getInstance()
 
-        if rm is None:
-            from jpype import JImplements, JOverride
-
-            @JImplements("java.lang.Runnable")
-            class CreateRoiManagerRunnable:
-                @JOverride
-                def run(self):
-                    holder[0] = RoiManager()
+        swing_utilities = _swing_utilities()
+        on_edt = swing_utilities.isEventDispatchThread()
 
-            from javax.swing import SwingUtilities
-            holder = [None]
-            SwingUtilities.invokeAndWait(CreateRoiManagerRunnable())
-            rm = holder[0]
+        if rm is None:
+            if on_edt:
+                rm = RoiManager()
+            else:
+                runnable = _create_roi_manager_runnable_class()(RoiManager)
+                swing_utilities.invokeAndWait(runnable)
+                rm = runnable.roi_manager
 
         # Get or assign integer group ID for this window
-        group_id = context.server._get_or_create_group_id(context.window_key)
+        group_id = context.group_id
+        if group_id is None:
+            group_id = context.server._get_or_create_group_id(context.window_key)
 
         roi_items = tuple(
             FijiROIWireItem.from_payload(item)
@@ -165,17 +229,27 @@ class FijiROIHandler(HandlerBase):
         )
 
         # Process ROIs with component positioning
-        channel_comps = context.components.get_by_mode("channel")
-        slice_comps = context.components.get_by_mode("slice")
-        frame_comps = context.components.get_by_mode("frame")
+        get_by_mode = context.components.get_by_mode
+        channel_comps = get_by_mode("channel")
+        slice_comps = get_by_mode("slice")
+        frame_comps = get_by_mode("frame")
 
         channel_position = FijiROIAxisPosition.from_items(roi_items, channel_comps)
         slice_position = FijiROIAxisPosition.from_items(roi_items, slice_comps)
         frame_position = FijiROIAxisPosition.from_items(roi_items, frame_comps)
 
-        total_rois_added = 0
+        # Loop-invariant converter and axis lookups are bound once per batch
+        to_java_rois = functools.partial(
+            FijiROIConverter.transmission_to_java_rois,
+            scyjava_module=sj,
+        )
+        channel_index = channel_position.one_based_position
+        slice_index = slice_position.one_based_position
+        frame_index = frame_position.one_based_position
 
-        from polystore.roi_converters import FijiROIConverter
+        # ROIs are staged in one Java list and added in a single EDT dispatch
+        staged_rois = _array_list_class()()
+        staged_acks: list[str] = []
 
         for roi_item in roi_items:
             rois_encoded = roi_item.rois
@@ -184,30 +258,37 @@ class FijiROIHandler(HandlerBase):
                     context.server._send_ack(image_id, status="success")
                 continue
 
-            logger.info(f"🔬 FIJI ROI HANDLER: Processing {len(rois_encoded)} ROIs")
+            logger.info("🔬 FIJI ROI HANDLER: Processing %d ROIs", len(rois_encoded))
 
             # Convert ROIs to ImageJ format
-            java_rois = FijiROIConverter.transmission_to_java_rois(
-                rois_encoded,
-                sj,
-            )
+            java_rois = to_java_rois(rois_encoded)
             imagej_position = (
-                channel_position.one_based_position(roi_item),
-                slice_position.one_based_position(roi_item),
-                frame_position.one_based_position(roi_item),
+                channel_index(roi_item),
+                slice_index(roi_item),
+                frame_index(roi_item),
             )
 
-            # Add ROIs to manager with group ID
+            # Stage ROIs for the manager with group ID
             for roi_obj in java_rois:
                 roi_obj.setPosition(*imagej_position)
                 roi_obj.setGroup(group_id)
-                rm.addRoi(roi_obj)
-
-            total_rois_added += len(java_rois)
+                staged_rois.add(roi_obj)
 
             if image_id := roi_item.image_id:
-                context.server._send_ack(image_id, status="success")
+                staged_acks.append(image_id)
+
+        total_rois_added = staged_rois.size()
+        if total_rois_added:
+            add_rois = _add_rois_runnable_class()(rm, staged_rois)
+            if on_edt:
+                add_rois.run()
+            else:
+                swing_utilities.invokeAndWait(add_rois)
+        for image_id in staged_acks:
+            context.server._send_ack(image_id, status="success")
 
         logger.info(
-            f"🔬 FIJI ROI HANDLER: Added {total_rois_added} ROIs to window '{context.window_key}'"
+            "🔬 FIJI ROI HANDLER: Added %d ROIs to window '%s'",
+            total_rois_added,
+            context.window_key,
         )
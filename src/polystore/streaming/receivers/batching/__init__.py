@@ -1,8 +0,0 @@
-"""
-Batching utilities for streaming receivers.
-
-This module can contain shared batching logic if needed in the future.
-"""
-
-__all__ = []
-
@@ -5,6 +5,7 @@ from __future__ import annotations
 import logging
 import threading
 import time
+from collections import deque
 from collections.abc import Callable
 from typing import Any
 
@@ -18,7 +19,13 @@ PendingBatch = tuple[list[dict[str, Any]], dict[str, Any]]
 
 
 class DebouncedBatchEngine(BatchEngineABC):
-    """Thread-safe debounce + max-wait batch processor."""
+    """Thread-safe debounce + max-wait batch processor.
+
+    One daemon worker waits on a condition until the pending deadline
+    passes, so a burst of enqueues shares a single thread. The worker exits
+    once nothing is pending and the next enqueue starts a fresh one, so an
+    idle engine holds no thread.
+    """
 
     def __init__(
         self,
@@ -31,32 +38,39 @@ class DebouncedBatchEngine(BatchEngineABC):
         self._debounce_delay = debounce_delay_ms / 1000.0
         self._max_wait = max_debounce_wait_ms / 1000.0
         self._lock = threading.Lock()
-        self._timer: threading.Timer | None = None
+        self._cond = threading.Condition(self._lock)
+        self._worker: threading.Thread | None = None
+        self._closed = False
+        self._deadline: float | None = None
         self._first_enqueue_time: float | None = None
-        self._pending_batches: list[PendingBatch] = []
+        # Reused across drains so flushes do not allocate a fresh container
+        self._pending_batches: deque[PendingBatch] = deque()
 
     def enqueue(self, items: list[dict[str, Any]], context: dict[str, Any]) -> None:
         should_process_now = False
         with self._lock:
             if items:
-                if self._pending_batches and self._pending_batches[-1][1] == context:
+                if self._pending_batches and (
+                    (last_context := self._pending_batches[-1][1]) is context
+                    or last_context == context
+                ):
                     self._pending_batches[-1][0].extend(items)
                 else:
                     self._pending_batches.append((list(items), context))
 
+            now = time.monotonic()
             if self._first_enqueue_time is None:
-                self._first_enqueue_time = time.time()
-
-            if self._timer is not None:
-                self._timer.cancel()
+                self._first_enqueue_time = now
 
-            elapsed = time.time() - self._first_enqueue_time
-            if elapsed >= self._max_wait:
+            elapsed = now - self._first_enqueue_time
+            if elapsed >= self._max_wait or self._closed:
                 should_process_now = True
+                self._deadline = None
             else:
                 remaining_wait = min(self._debounce_delay, self._max_wait - elapsed)
-                self._timer = threading.Timer(remaining_wait, self.flush)
-                self._timer.start()
+                self._deadline = now + remaining_wait
+                self._ensure_worker_locked()
+                self._cond.notify()
 
         if should_process_now:
             self.flush()
@@ -68,17 +82,48 @@ class DebouncedBatchEngine(BatchEngineABC):
             except Exception as exc:
                 logger.error("DebouncedBatchEngine: processing failed: %s", exc, exc_info=True)
 
+    def close(self) -> None:
+        """Stop the worker thread after processing anything still pending."""
+        with self._lock:
+            self._closed = True
+            self._cond.notify()
+            worker = self._worker
+            self._worker = None
+        if worker is not None and worker is not threading.current_thread():
+            worker.join()
+        self.flush()
+
+    def _ensure_worker_locked(self) -> None:
+        if self._worker is None:
+            self._worker = threading.Thread(
+                target=self._run_worker,
+                name="DebouncedBatchEngine",
+                daemon=True,
+            )
+            self._worker.start()
+
+    def _run_worker(self) -> None:
+        while True:
+            with self._cond:
+                while True:
+                    if self._closed or self._deadline is None:
+                        if self._worker is threading.current_thread():
+                            self._worker = None
+                        return
+                    remaining = self._deadline - time.monotonic()
+                    if remaining <= 0:
+                        self._deadline = None
+                        break
+                    self._cond.wait(remaining)
+            self.flush()
+
     def _drain_locked(self) -> list[PendingBatch]:
         with self._lock:
+            self._deadline = None
+            self._first_enqueue_time = None
             if not self._pending_batches:
-                self._timer = None
-                self._first_enqueue_time = None
                 return []
 
-            batches = self._pending_batches
-
-            self._pending_batches = []
-            self._timer = None
-            self._first_enqueue_time = None
-
+            batches = list(self._pending_batches)
+            self._pending_batches.clear()
             return batches
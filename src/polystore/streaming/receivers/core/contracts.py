@@ -19,6 +19,10 @@ class BatchEngineABC(ABC):
         """Immediately process any pending queued items."""
         raise NotImplementedError
 
+    def close(self) -> None:
+        """Process pending items and release any background worker."""
+        self.flush()
+
 
 class WindowProjectionABC(ABC):
     """Contract for item grouping/projection by component modes."""
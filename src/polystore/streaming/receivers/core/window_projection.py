@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+import functools
+import operator
+import sys
 from abc import ABC, abstractmethod
-from collections.abc import Mapping, Sequence
+from collections.abc import Callable, Mapping, Sequence
 from dataclasses import dataclass
-from typing import Generic, TypeVar
+from typing import Any, Generic, TypeVar
 
 from polystore.streaming.identity import (
     StreamProducerDisplayNameAuthority,
@@ -28,6 +31,8 @@ WINDOW_COMPONENT_MODES = (
     ViewerComponentMode.FRAME,
 )
 WindowLabel = tuple[str, ViewerWireValue]
+# Marks declared components absent from an item's metadata
+_MISSING = object()
 WindowProjectionItemT = TypeVar("WindowProjectionItemT")
 WindowProjectionProviderT = TypeVar(
     "WindowProjectionProviderT",
@@ -58,10 +63,10 @@ class WindowItemPayload(dict[str, ViewerWireValue]):
 class GroupedWindowItems(Generic[WindowProjectionItemT]):
     """Projection result for a single batch."""
 
-    window_components: list[str]
-    channel_components: list[str]
-    slice_components: list[str]
-    frame_components: list[str]
+    window_components: tuple[str, ...]
+    channel_components: tuple[str, ...]
+    slice_components: tuple[str, ...]
+    frame_components: tuple[str, ...]
     windows: dict[str, list[WindowProjectionItemT]]
     fixed_window_labels: dict[str, tuple[WindowLabel, ...]]
 
@@ -148,87 +153,230 @@ def group_items_by_component_modes(
     display_layout: ViewerBatchDisplayPayload,
 ) -> GroupedWindowItems[WindowProjectionItemT]:
     """Project items into window groups using declared component modes."""
-    mode_groups = display_layout.component_mode_groups(WINDOW_COMPONENT_MODES)
-    mode_groups.require_all_supported("window projection")
-
-    window_components = list(
-        mode_groups.components_for_mode(ViewerComponentMode.WINDOW)
-    )
-    channel_components = list(
-        mode_groups.components_for_mode(ViewerComponentMode.CHANNEL)
-    )
-    slice_components = list(
-        mode_groups.components_for_mode(ViewerComponentMode.SLICE)
-    )
-    frame_components = list(
-        mode_groups.components_for_mode(ViewerComponentMode.FRAME)
-    )
+    component_order = tuple(display_layout.component_order)
+    try:
+        grouper = _compile_grouper(
+            component_order,
+            tuple(display_layout.component_modes.items()),
+        )
+    except TypeError:
+        grouper = _WindowGrouper.from_layout(display_layout)
+    window_components = grouper.window_components
+    coordinate_of = grouper.coordinate_of
+    window_values_of = grouper.window_values_of
 
     windows: dict[str, list[WindowProjectionItemT]] = {}
     fixed_window_labels: dict[str, tuple[WindowLabel, ...]] = {}
-    projected_sources_by_window: dict[
+    # First producer seen at each (window, data type, full coordinate); one
+    # dict probe per item replaces a scan over the window's earlier items
+    producers_by_coordinate: dict[tuple, StreamProducerIdentity] = {}
+    unhashable_sources_by_window: dict[
         str,
-        list[WindowProjectionSource[WindowProjectionItemT]],
+        list[tuple[WindowProjectionSource[WindowProjectionItemT], tuple]],
     ] = {}
+    # Route keys and labels are formatted once per distinct producer/window
+    # coordinate; value types are part of the key because 1, 1.0 and True
+    # hash alike but format differently
+    window_keys_by_group: dict[
+        tuple,
+        tuple[str, tuple[WindowLabel, ...]],
+    ] = {}
+
+    data_type_field = ViewerBatchItemWireField.DATA_TYPE.value
+    # Streams usually land consecutive items in one window, so the last
+    # group is checked by equality before any hashing
+    hot_group_key: tuple | None = None
+    hot_window_key = ""
+    hot_window_items: list[WindowProjectionItemT] = []
 
     for item in items:
-        for component in display_layout.component_order:
-            if component not in item.metadata:
-                raise ValueError(
-                    "Viewer window projection item missing declared component "
-                    f"{component!r}."
+        metadata = item.metadata
+        producer = item.producer
+        try:
+            coordinate = coordinate_of(metadata)
+        except KeyError:
+            missing = next(c for c in component_order if c not in metadata)
+            raise ValueError(
+                "Viewer window projection item missing declared component "
+                f"{missing!r}."
+            ) from None
+        window_values = window_values_of(coordinate)
+        group_key = (
+            producer,
+            window_values,
+            tuple(map(type, window_values)),
+        )
+        if group_key == hot_group_key:
+            window_key = hot_window_key
+            window_items = hot_window_items
+        else:
+            try:
+                window_key, fixed_labels = window_keys_by_group[group_key]
+            except KeyError:
+                window_key, fixed_labels = _window_key_and_labels(
+                    producer,
+                    window_components,
+                    window_values,
                 )
-        key_parts: list[str] = list(item.producer.route_parts())
-        fixed_labels: list[WindowLabel] = [
-            (
-                "producer",
-                StreamProducerDisplayNameAuthority.output_label(item.producer),
-            )
-        ]
-
-        for comp in window_components:
-            value = item.metadata[comp]
-            key_parts.append(f"{comp}_{value}")
-            fixed_labels.append((comp, value))
-
-        window_key = StreamRouteKeyAuthority.join(key_parts)
-        data_type_field = ViewerBatchItemWireField.DATA_TYPE.value
-        if data_type_field not in item.payload:
+                window_keys_by_group[group_key] = (window_key, fixed_labels)
+            except TypeError:
+                # Unhashable component values are formatted per item
+                window_key, fixed_labels = _window_key_and_labels(
+                    producer,
+                    window_components,
+                    window_values,
+                )
+            window_items = windows.get(window_key)
+            if window_items is None:
+                window_items = windows[window_key] = []
+                fixed_window_labels[window_key] = fixed_labels
+            hot_group_key = group_key
+            hot_window_key = window_key
+            hot_window_items = window_items
+        data_type = item.payload.get(data_type_field, _MISSING)
+        if data_type is _MISSING:
             raise ValueError(
                 "Viewer window projection item missing required field "
                 f"{data_type_field!r}."
             )
-        for projected_source in projected_sources_by_window.setdefault(
-            window_key,
-            [],
-        ):
-            if (
-                projected_source.payload[data_type_field]
-                == item.payload[data_type_field]
-                and all(
-                    projected_source.metadata[component]
-                    == item.metadata[component]
-                    for component in display_layout.component_order
-                )
-                and projected_source.producer != item.producer
-            ):
-                raise ValueError(
-                    "Viewer projection has distinct producers for the same "
-                    "component coordinate and data type: "
-                    f"{projected_source.producer.output_key!r} and "
-                    f"{item.producer.output_key!r}."
-                )
-        projected_sources_by_window[window_key].append(item)
-        if window_key not in fixed_window_labels:
-            windows[window_key] = []
-            fixed_window_labels[window_key] = tuple(fixed_labels)
-        windows[window_key].append(item.item)
+        try:
+            first_producer = producers_by_coordinate.setdefault(
+                (window_key, data_type, coordinate),
+                producer,
+            )
+        except TypeError:
+            first_producer = _first_producer_at_coordinate(
+                unhashable_sources_by_window.setdefault(window_key, []),
+                data_type_field,
+                item,
+                coordinate,
+            )
+        if first_producer is not producer and first_producer != producer:
+            raise ValueError(
+                "Viewer projection has distinct producers for the same "
+                "component coordinate and data type: "
+                f"{first_producer.output_key!r} and "
+                f"{producer.output_key!r}."
+            )
+        window_items.append(item.item)
 
     return GroupedWindowItems(
         window_components=window_components,
-        channel_components=channel_components,
-        slice_components=slice_components,
-        frame_components=frame_components,
+        channel_components=grouper.channel_components,
+        slice_components=grouper.slice_components,
+        frame_components=grouper.frame_components,
         windows=windows,
         fixed_window_labels=fixed_window_labels,
     )
+
+
+TupleGetter = Callable[[Any], tuple]
+
+
+@dataclass(frozen=True, slots=True)
+class _WindowGrouper:
+    """Per-layout specialization of window projection.
+
+    Component buckets and the getters that pull an item's coordinate and
+    window values are resolved once per display layout, so the per-item
+    loop does no mode dispatch and reads metadata through C-level
+    itemgetters.
+    """
+
+    window_components: tuple[str, ...]
+    channel_components: tuple[str, ...]
+    slice_components: tuple[str, ...]
+    frame_components: tuple[str, ...]
+    coordinate_of: TupleGetter
+    window_values_of: TupleGetter
+
+    @classmethod
+    def from_layout(
+        cls,
+        display_layout: ViewerBatchDisplayPayload,
+    ) -> _WindowGrouper:
+        mode_groups = display_layout.component_mode_groups(WINDOW_COMPONENT_MODES)
+        mode_groups.require_all_supported("window projection")
+        window, channel, slice_, frame = (
+            tuple(
+                sys.intern(component)
+                for component in mode_groups.components_for_mode(mode)
+            )
+            for mode in WINDOW_COMPONENT_MODES
+        )
+        component_order = tuple(
+            sys.intern(component) for component in display_layout.component_order
+        )
+        return cls(
+            window_components=window,
+            channel_components=channel,
+            slice_components=slice_,
+            frame_components=frame,
+            coordinate_of=_tuple_getter(component_order),
+            window_values_of=_tuple_getter(
+                tuple(component_order.index(component) for component in window)
+            ),
+        )
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_grouper(
+    component_order: tuple[str, ...],
+    component_modes: tuple[tuple[str, str], ...],
+) -> _WindowGrouper:
+    """Memoized grouper specialization for one display layout."""
+    return _WindowGrouper.from_layout(
+        ViewerBatchDisplayPayload(
+            component_modes=dict(component_modes),
+            component_order=component_order,
+        )
+    )
+
+
+def _tuple_getter(keys: tuple) -> TupleGetter:
+    """Return a callable that extracts ``keys`` from a source as a tuple."""
+    if not keys:
+        return lambda _source: ()
+    if len(keys) == 1:
+        getter = operator.itemgetter(keys[0])
+        return lambda source: (getter(source),)
+    return operator.itemgetter(*keys)
+
+
+def _window_key_and_labels(
+    producer: StreamProducerIdentity,
+    window_components: Sequence[str],
+    window_values: tuple[ViewerWireValue, ...],
+) -> tuple[str, tuple[WindowLabel, ...]]:
+    key_parts: list[str] = list(producer.route_parts())
+    fixed_labels: list[WindowLabel] = [
+        (
+            "producer",
+            StreamProducerDisplayNameAuthority.output_label(producer),
+        )
+    ]
+    for comp, value in zip(window_components, window_values, strict=True):
+        if isinstance(value, str):
+            value = sys.intern(value)
+        key_parts.append(f"{comp}_{value}")
+        fixed_labels.append((comp, value))
+    # Window keys are reused as dict keys for every item in the group
+    return sys.intern(StreamRouteKeyAuthority.join(key_parts)), tuple(fixed_labels)
+
+
+def _first_producer_at_coordinate(
+    window_sources: list[tuple[WindowProjectionSource, tuple]],
+    data_type_field: str,
+    item: WindowProjectionSource,
+    coordinate: tuple,
+) -> StreamProducerIdentity:
+    """Linear fallback for coordinates or data types that are not hashable."""
+    data_type = item.payload[data_type_field]
+    for projected_source, projected_coordinate in window_sources:
+        if (
+            projected_source.payload[data_type_field] == data_type
+            and projected_coordinate == coordinate
+        ):
+            return projected_source.producer
+    window_sources.append((item, coordinate))
+    return item.producer
@@ -16,6 +16,15 @@ class FijiBatchProcessor:
     
     Uses debouncing to collect items arriving in rapid succession.
     """
+
+    __slots__ = (
+        "fiji_server",
+        "batch_size",
+        "debounce_delay_ms",
+        "max_debounce_wait_ms",
+        "_context_by_window",
+        "_engine",
+    )
     
     def __init__(
         self,
@@ -39,6 +48,11 @@ class FijiBatchProcessor:
         self.debounce_delay_ms = debounce_delay_ms
         self.max_debounce_wait_ms = max_debounce_wait_ms
         
+        # Context of each window's pending batch; reused while its inputs are
+        # unchanged so bursts coalesce in the engine on an identity check, and
+        # dropped once that batch is processed
+        self._context_by_window: Dict[str, Dict[str, Any]] = {}
+
         self._engine = DebouncedBatchEngine(
             process_fn=self._process_batch,
             debounce_delay_ms=debounce_delay_ms,
@@ -46,8 +60,10 @@ class FijiBatchProcessor:
         )
         
         logger.info(
-            f"FijiBatchProcessor: Created with batch_size={batch_size}, "
-            f"debounce={debounce_delay_ms}ms, max_wait={max_debounce_wait_ms}ms"
+            "FijiBatchProcessor: Created with batch_size=%s, debounce=%dms, max_wait=%dms",
+            batch_size,
+            debounce_delay_ms,
+            max_debounce_wait_ms,
         )
     
     def add_items(
@@ -70,13 +86,22 @@ class FijiBatchProcessor:
             component_names_metadata: Component name mappings for dimension labels
             component_value_domain: Component value domains for axis cardinality
         """
-        context = {
-            "display_config": display_config,
-            "images_dir": images_dir,
-            "component_names_metadata": component_names_metadata,
-            "component_value_domain": component_value_domain,
-            "window_key": window_key,
-        }
+        context = self._context_by_window.get(window_key)
+        if (
+            context is None
+            or context["display_config"] is not display_config
+            or context["images_dir"] != images_dir
+            or context["component_names_metadata"] is not component_names_metadata
+            or context["component_value_domain"] is not component_value_domain
+        ):
+            context = {
+                "display_config": display_config,
+                "images_dir": images_dir,
+                "component_names_metadata": component_names_metadata,
+                "component_value_domain": component_value_domain,
+                "window_key": window_key,
+            }
+            self._context_by_window[window_key] = context
         self._engine.enqueue(items=items, context=context)
         logger.debug(
             "FijiBatchProcessor: Added %d items to batch for window '%s'",
@@ -88,6 +113,11 @@ class FijiBatchProcessor:
         """Force immediate processing of the pending batch."""
         self._engine.flush()
 
+    def close(self) -> None:
+        """Process any pending batch and stop the engine's debounce worker."""
+        self._engine.close()
+        self._context_by_window.clear()
+
     def _process_batch(self, items: List[Dict[str, Any]], context: Dict[str, Any]) -> None:
         """Process callback used by shared debounced batch engine."""
         display_config = context["display_config"]
@@ -95,6 +125,9 @@ class FijiBatchProcessor:
         component_names_metadata = context["component_names_metadata"]
         component_value_domain = context["component_value_domain"]
         window_key = context["window_key"]
+        cached_context = self._context_by_window.get(window_key)
+        if cached_context is context or cached_context == context:
+            self._context_by_window.pop(window_key, None)
         logger.info(
             "FijiBatchProcessor: Processing batch of %d items for window '%s'",
             len(items),
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import functools
+import sys
 from collections.abc import Mapping
 
 from polystore.streaming.identity import StreamProducerIdentity, StreamRouteKeyAuthority
@@ -15,6 +17,10 @@ from zmqruntime.viewer_protocol import (
 )
 
 
+# Marks slice components absent from an item's component info
+_MISSING = object()
+
+
 def normalize_component_layout(
     display_config: ViewerBatchDisplayPayload | ViewerWireMapping,
 ) -> ViewerBatchDisplayPayload:
@@ -22,16 +28,10 @@ def normalize_component_layout(
     if isinstance(display_config, ViewerBatchDisplayPayload):
         return display_config
     if isinstance(display_config, dict):
-        return ViewerBatchDisplayPayload(
-            component_modes=_required_mapping(
-                display_config,
-                ViewerDisplayConfigWireField.COMPONENT_MODES.value,
-            ),
-            component_order=_required_sequence(
-                display_config,
-                ViewerDisplayConfigWireField.COMPONENT_ORDER.value,
-            ),
-        )
+        fingerprint = _layout_fingerprint(display_config)
+        if fingerprint is not None:
+            return _layout_for_fingerprint(*fingerprint)
+        return _layout_from_mapping(display_config)
 
     raise TypeError(
         "Napari component layout requires ViewerBatchDisplayPayload or mapping, "
@@ -48,18 +48,96 @@ def build_route_key(
     """Build hidden route key from producer identity, slice components, and type."""
     producer = StreamProducerIdentity.from_payload(producer_identity)
     route_parts: list[str] = list(producer.route_parts())
-    for component in display_layout.components_for_mode(ViewerComponentMode.SLICE):
-        if component not in component_info:
+    for component in _slice_components(display_layout):
+        value = component_info.get(component, _MISSING)
+        if value is _MISSING:
             raise ValueError(
                 f"Napari route key missing slice component {component!r}."
             )
-        route_parts.append(f"{component}_{component_info[component]}")
+        route_parts.append(f"{component}_{value}")
 
     route_key = StreamRouteKeyAuthority.join(route_parts)
 
     return f"{route_key}{data_type.napari_layer_suffix}"
 
 
+def _layout_from_mapping(
+    display_config: ViewerWireMapping,
+) -> ViewerBatchDisplayPayload:
+    return ViewerBatchDisplayPayload(
+        component_modes=_required_mapping(
+            display_config,
+            ViewerDisplayConfigWireField.COMPONENT_MODES.value,
+        ),
+        component_order=_required_sequence(
+            display_config,
+            ViewerDisplayConfigWireField.COMPONENT_ORDER.value,
+        ),
+    )
+
+
+def _layout_fingerprint(
+    display_config: ViewerWireMapping,
+) -> tuple[tuple, tuple] | None:
+    """Return a hashable view of a well-formed layout mapping, else None."""
+    component_modes = display_config.get(
+        ViewerDisplayConfigWireField.COMPONENT_MODES.value
+    )
+    component_order = display_config.get(
+        ViewerDisplayConfigWireField.COMPONENT_ORDER.value
+    )
+    if not isinstance(component_modes, Mapping) or not isinstance(
+        component_order, list | tuple
+    ):
+        return None
+    fingerprint = (tuple(component_modes.items()), tuple(component_order))
+    try:
+        hash(fingerprint)
+    except TypeError:
+        return None
+    return fingerprint
+
+
+@functools.lru_cache(maxsize=128)
+def _layout_for_fingerprint(
+    component_modes: tuple,
+    component_order: tuple,
+) -> ViewerBatchDisplayPayload:
+    # Display configs repeat per message, so validation runs once per layout
+    return _layout_from_mapping(
+        {
+            ViewerDisplayConfigWireField.COMPONENT_MODES.value: dict(component_modes),
+            ViewerDisplayConfigWireField.COMPONENT_ORDER.value: list(component_order),
+        }
+    )
+
+
+def _slice_components(display_layout: ViewerBatchDisplayPayload) -> tuple[str, ...]:
+    component_order = tuple(display_layout.component_order)
+    component_modes = display_layout.component_modes
+    mode_key = tuple(component_modes.get(component) for component in component_order)
+    try:
+        return _slice_components_for(component_order, mode_key)
+    except TypeError:
+        return display_layout.components_for_mode(ViewerComponentMode.SLICE)
+
+
+@functools.lru_cache(maxsize=128)
+def _slice_components_for(
+    component_order: tuple[str, ...],
+    component_modes: tuple,
+) -> tuple[str, ...]:
+    slice_components = ViewerBatchDisplayPayload(
+        component_modes={
+            component: mode
+            for component, mode in zip(component_order, component_modes, strict=True)
+            if mode is not None
+        },
+        component_order=component_order,
+    ).components_for_mode(ViewerComponentMode.SLICE)
+    return tuple(sys.intern(component) for component in slice_components)
+
+
 def _required_mapping(
     payload: Mapping[str, ViewerWireValue],
     field_name: str,
@@ -73,7 +151,7 @@ def _required_mapping(
             f"got {type(value).__name__}."
         )
     return {
-        str(component): str(mode)
+        sys.intern(str(component)): str(mode)
         for component, mode in value.items()
     }
 
@@ -90,4 +168,4 @@ def _required_sequence(
             f"Display config field {field_name!r} must be a sequence, "
             f"got {type(value).__name__}."
         )
-    return [str(component) for component in value]
+    return [sys.intern(str(component)) for component in value]
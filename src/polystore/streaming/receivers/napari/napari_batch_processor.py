@@ -9,7 +9,7 @@ NapariDisplayPayloadT = TypeVar("NapariDisplayPayloadT")
 NapariComponentNamesMetadataT = TypeVar("NapariComponentNamesMetadataT")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class NapariBatchDisplayRequest(
     Generic[
         NapariBatchItemT,
@@ -42,6 +42,13 @@ class NapariBatchProcessor:
     adapts batch payloads into the server display operation.
     """
 
+    __slots__ = (
+        "napari_server",
+        "batch_size",
+        "debounce_delay_ms",
+        "max_debounce_wait_ms",
+    )
+
     def __init__(
         self,
         napari_server,
@@ -64,8 +71,10 @@ class NapariBatchProcessor:
         self.max_debounce_wait_ms = max_debounce_wait_ms
 
         logger.info(
-            f"NapariBatchProcessor: Created with batch_size={batch_size}, "
-            f"debounce={debounce_delay_ms}ms, max_wait={max_debounce_wait_ms}ms"
+            "NapariBatchProcessor: Created with batch_size=%s, debounce=%dms, max_wait=%dms",
+            batch_size,
+            debounce_delay_ms,
+            max_debounce_wait_ms,
         )
 
     def add_items(
@@ -4,14 +4,18 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from collections.abc import Mapping, Sequence
-from dataclasses import dataclass, field, replace
+from dataclasses import dataclass, field, is_dataclass, replace
 from enum import Enum
+from functools import cached_property, lru_cache
 from pathlib import Path
+from types import MappingProxyType
 from typing import (
     ClassVar,
     TypeAlias,
 )
 
+import zmq
+
 from polystore.registry import AutoRegisterMeta
 from polystore.streaming.identity import StreamProducerIdentity
 from polystore.streaming_constants import StreamingDataType
@@ -143,11 +147,41 @@ class ExplicitViewerTransportConfig(ViewerTransportConfigSelection):
         return self.config
 
 
+@dataclass(frozen=True)
+class ViewerSocketTuning:
+    """Send-side queue and kernel buffer sizes for one viewer data socket."""
+
+    send_hwm: int
+    send_buffer_bytes: int
+
+
+class ViewerSocketProfile(Enum):
+    """Latency/throughput trade-off for viewer data sockets.
+
+    A small kernel send buffer gets each batch onto the wire sooner and keeps
+    queued data small; a large one lets multi-megabyte batches be handed off
+    in fewer syscalls. Viewer sockets are REQ, so at most one batch is in
+    flight and the high-water mark only bounds that batch's frame count.
+    """
+
+    LATENCY = ViewerSocketTuning(send_hwm=16, send_buffer_bytes=1024 * 1024)
+    BALANCED = ViewerSocketTuning(send_hwm=1000, send_buffer_bytes=16 * 1024 * 1024)
+    THROUGHPUT = ViewerSocketTuning(send_hwm=8192, send_buffer_bytes=64 * 1024 * 1024)
+
+
 @dataclass(frozen=True)
 class ViewerTransportDefaults:
     """Declared transport defaults shared by viewer streaming backends."""
 
     ack_timeout_ms: int = 30_000
+    # Queue requests only on completed connections; the profile sizes the
+    # send queue and kernel buffer for multi-megabyte batch messages.
+    immediate: bool = True
+    socket_profile: ViewerSocketProfile = ViewerSocketProfile.BALANCED
+    # Remote TCP viewers keep idle connections alive between batches; libzmq
+    # already disables Nagle on TCP and the options are ignored for IPC.
+    tcp_keepalive: bool = True
+    tcp_keepalive_idle_seconds: int = 60
 
     def ack_policy(self, viewer_name: str) -> ViewerAckPolicy:
         return ViewerAckPolicy(
@@ -155,6 +189,19 @@ class ViewerTransportDefaults:
             timeout_ms=self.ack_timeout_ms,
         )
 
+    def apply_socket_options(
+        self,
+        socket: zmq.Socket,
+        profile: ViewerSocketProfile | None = None,
+    ) -> None:
+        tuning = (profile or self.socket_profile).value
+        socket.setsockopt(zmq.IMMEDIATE, int(self.immediate))
+        socket.setsockopt(zmq.SNDHWM, tuning.send_hwm)
+        socket.setsockopt(zmq.SNDBUF, tuning.send_buffer_bytes)
+        socket.setsockopt(zmq.TCP_KEEPALIVE, int(self.tcp_keepalive))
+        if self.tcp_keepalive:
+            socket.setsockopt(zmq.TCP_KEEPALIVE_IDLE, self.tcp_keepalive_idle_seconds)
+
 
 class ViewerSourceComponentMetadataPayload(dict[str, ViewerWireValue]):
     """Validated component metadata payload for one streamed source item."""
@@ -396,16 +443,29 @@ class ViewerStreamDisplaySemantics:
 
     display_config: ViewerDisplayConfigABC
 
-    @property
+    @classmethod
+    def for_display_config(
+        cls,
+        display_config: ViewerDisplayConfigABC,
+    ) -> "ViewerStreamDisplaySemantics":
+        """Return semantics shared across batches for immutable display configs."""
+        if is_dataclass(display_config) and display_config.__dataclass_params__.frozen:
+            try:
+                return _frozen_display_semantics(display_config)
+            except TypeError:
+                pass
+        return cls(display_config)
+
+    @cached_property
     def component_order(self) -> tuple[str, ...]:
         return tuple(str(component) for component in self.display_config.COMPONENT_ORDER)
 
-    @property
-    def component_modes(self) -> dict[str, str]:
-        return {
+    @cached_property
+    def component_modes(self) -> Mapping[str, str]:
+        return MappingProxyType({
             str(component): str(mode.value if isinstance(mode, Enum) else mode)
             for component, mode in self.display_config.component_modes().items()
-        }
+        })
 
     def batch_display_payload(
         self,
@@ -422,6 +482,13 @@ class ViewerStreamDisplaySemantics:
         )
 
 
+@lru_cache(maxsize=64)
+def _frozen_display_semantics(
+    display_config: ViewerDisplayConfigABC,
+) -> ViewerStreamDisplaySemantics:
+    return ViewerStreamDisplaySemantics(display_config)
+
+
 @dataclass(frozen=True, kw_only=True, slots=True)
 class ViewerStreamMessageContext:
     """Viewer message context carried through stream request boundaries."""
@@ -481,9 +548,9 @@ class ViewerStreamRequest(ViewerStreamMessageContext):
     def transport_mode(self) -> ViewerTransportMode:
         return self.viewer_transport.transport_mode
 
-    @property
+    @cached_property
     def display_semantics(self) -> ViewerStreamDisplaySemantics:
-        return ViewerStreamDisplaySemantics(self.display_config)
+        return ViewerStreamDisplaySemantics.for_display_config(self.display_config)
 
 
 ViewerStreamKwargPayloadMapping: TypeAlias = Mapping[
@@ -23,12 +23,16 @@ class StreamingDataType(Enum):
     @property
     def napari_layer_suffix(self) -> str:
         """Layer-key suffix contributed by this data type."""
-        return {
-            type(self).IMAGE: "",
-            type(self).SHAPES: "_shapes",
-            type(self).POINTS: "_points",
-            type(self).ROIS: "",
-        }[self]
+        return _NAPARI_LAYER_SUFFIXES[self]
+
+
+# Built once; route keys look the suffix up per streamed message
+_NAPARI_LAYER_SUFFIXES = {
+    StreamingDataType.IMAGE: "",
+    StreamingDataType.SHAPES: "_shapes",
+    StreamingDataType.POINTS: "_points",
+    StreamingDataType.ROIS: "",
+}
 
 
 class NapariShapeType(Enum):
@@ -2,7 +2,10 @@
 Utility functions for polystore.
 """
 
+import fnmatch
+import os
 import re
+from collections.abc import Callable
 from pathlib import Path
 from typing import List, Union
 
@@ -27,6 +30,20 @@ def natural_sort_inplace(items: List[Union[str, Path]]) -> None:
     items.sort(key=natural_sort_key)
 
 
+def compile_filename_pattern(pattern: str | None) -> Callable[[str], bool] | None:
+    """Compile a glob pattern once into a predicate with ``fnmatch.fnmatch`` semantics.
+
+    Returns None when the pattern matches everything, so listing loops can skip
+    the per-name check entirely.
+    """
+    if pattern is None or pattern == "*":
+        return None
+    match = re.compile(fnmatch.translate(os.path.normcase(pattern))).match
+    if os.path.normcase("A") == "A":
+        return lambda name: match(name) is not None
+    return lambda name: match(os.path.normcase(name)) is not None
+
+
 def get_zmq_transport_url(port: int, transport_mode: str = "tcp") -> str:
     """Get ZeroMQ transport URL (simple fallback utility)."""
     if transport_mode == "tcp":
@@ -6,7 +6,6 @@ import json
 import logging
 from collections.abc import Mapping
 from dataclasses import dataclass, fields, replace
-from fnmatch import fnmatch
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Set, Union
 
@@ -23,6 +22,7 @@ from .base import (
 from .constants import Backend
 from .exceptions import StorageResolutionError
 from .metadata_writer import get_metadata_path
+from .utils import compile_filename_pattern
 
 logger = logging.getLogger(__name__)
 
@@ -333,6 +333,7 @@ class VirtualWorkspaceBackend(ReadOnlyBackend, PicklableBackend):
         lowercase_extensions = (
             None if extensions is None else {extension.lower() for extension in extensions}
         )
+        matches_pattern = compile_filename_pattern(pattern)
         results: list[str] = []
         for virtual_relative in self._load_mapping():
             path = Path(virtual_relative)
@@ -345,7 +346,7 @@ class VirtualWorkspaceBackend(ReadOnlyBackend, PicklableBackend):
                     continue
             elif parent != relative_directory_text:
                 continue
-            if pattern is not None and not fnmatch(path.name, pattern):
+            if matches_pattern is not None and not matches_pattern(path.name):
                 continue
             if (
                 lowercase_extensions is not None
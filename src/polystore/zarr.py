@@ -7,7 +7,6 @@ It stores data in a Zarr store on disk and supports overlay operations
 for materializing data to disk when needed.
 """
 
-import fnmatch
 import logging
 import os
 import threading
@@ -106,6 +105,7 @@ except ImportError:
 from .constants import Backend
 from .base import PicklableBackend, StorageBackend
 from .exceptions import StorageResolutionError
+from .utils import compile_filename_pattern
 
 
 class ZarrStorageBackend(StorageBackend, PicklableBackend):
@@ -715,8 +715,10 @@ class ZarrStorageBackend(StorageBackend, PicklableBackend):
         store, relative_key = self._split_store_and_key(directory)
         result: List[Path] = []
 
+        matches_pattern = compile_filename_pattern(pattern or None)
+
         def _matches_filters(name: str) -> bool:
-            if pattern and not fnmatch.fnmatch(name, pattern):
+            if matches_pattern is not None and not matches_pattern(name):
                 return False
             if extensions:
                 return any(name.lower().endswith(ext.lower()) for ext in extensions)
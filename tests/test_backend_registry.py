@@ -17,3 +17,10 @@ def test_get_backend_instance_and_cleanup():
     # after cleanup the instances should be new objects
     mem3 = br.get_backend_instance("memory")
     assert mem3 is not mem1
+
+
+def test_item_handler_registry_is_the_lazy_discovery_dict():
+    from polystore.streaming.handlers import _ITEM_HANDLERS, HandlerBase
+
+    assert HandlerBase.__registry__ is _ITEM_HANDLERS
+    assert {"image", "rois"} <= set(_ITEM_HANDLERS)
@@ -15,6 +15,23 @@ def test_import():
     assert polystore.__version__.strip() != ""
 
 
+def test_import_defers_core_backend_modules():
+    """Test that core backend modules load on first attribute access."""
+    import subprocess
+    import sys
+
+    script = (
+        "import sys, polystore\n"
+        "assert 'polystore.disk' not in sys.modules\n"
+        "assert 'polystore.filemanager' not in sys.modules\n"
+        "assert {'FileManager', 'FijiStreamingBackend'} <= set(dir(polystore))\n"
+        "from polystore import DiskStorageBackend, FileManager\n"
+        "assert polystore.__dict__['FileManager'] is FileManager\n"
+        "assert DiskStorageBackend.__module__ == 'polystore.disk'\n"
+    )
+    subprocess.run([sys.executable, "-c", script], check=True)
+
+
 def test_memory_backend():
     """Test memory backend basic functionality."""
     from polystore import MemoryBackend
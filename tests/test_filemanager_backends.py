@@ -53,6 +53,118 @@ def test_omero_backend_qualifies_relative_listed_addresses() -> None:
     ) == "/omero/plate_8/A01_s001_w1_z001_t001.tif"
 
 
+def test_omero_backend_load_batch_reads_planes_once_per_image() -> None:
+    from polystore.omero_local import ImageStructure, OMEROPixelsCache, WellStructure
+
+    class ParserStub:
+        def parse_filename(self, filename):
+            well, site, channel, z = filename.removesuffix(".tif").split("_")
+            return {
+                "well": well,
+                "site": int(site),
+                "channel": int(channel),
+                "z_index": int(z),
+                "timepoint": 1,
+            }
+
+    class PixelsStub:
+        def __init__(self, image_id):
+            self.image_id = image_id
+            self.requests = []
+
+        def getPlanes(self, zct_list):
+            self.requests.append(list(zct_list))
+            for z, c, _t in zct_list:
+                yield np.full((2, 2), self.image_id * 100 + z * 10 + c)
+
+    def image(image_id):
+        return ImageStructure(
+            image_id=image_id, sizeZ=2, sizeC=2, sizeT=1, sizeY=2, sizeX=2
+        )
+
+    backend = object.__new__(OMEROLocalBackend)
+    backend._plate_metadata = {
+        7: PlateStructure(
+            plate_id=7,
+            parser_name="ParserStub",
+            microscope_type="stub",
+            wells={
+                "A01": WellStructure(sites={1: image(1)}),
+                "A02": WellStructure(sites={1: image(2)}),
+            },
+            all_well_ids={"A01", "A02"},
+            max_sites=1,
+            max_z=2,
+            max_c=2,
+            max_t=1,
+        )
+    }
+    pixels = {1: PixelsStub(1), 2: PixelsStub(2)}
+
+    class ImageStub:
+        def __init__(self, image_id):
+            self.image_id = image_id
+
+        def getId(self):
+            return self.image_id
+
+        def getPrimaryPixels(self):
+            return pixels[self.image_id]
+
+    class ConnectionStub:
+        def __init__(self):
+            self.queries = []
+
+        def getObjects(self, object_type, ids):
+            self.queries.append((object_type, list(ids)))
+            return [ImageStub(image_id) for image_id in ids]
+
+        def getObject(self, object_type, image_id):
+            self.queries.append((object_type, image_id))
+            return ImageStub(image_id)
+
+    conn = ConnectionStub()
+    backend._parser_cache = {7: ParserStub()}
+    backend._pixels_cache = OMEROPixelsCache()
+    backend._get_connection = lambda **kwargs: conn
+
+    planes = backend.load_batch([
+        "/omero/plate_7/A01_1_1_2.tif",
+        "/omero/plate_7/A02_1_2_1.tif",
+        "/omero/plate_7/A01_1_2_1.tif",
+    ])
+    backend.load_batch(["/omero/plate_7/A02_1_1_1.tif"])
+
+    assert [int(plane[0, 0]) for plane in planes] == [110, 201, 101]
+    assert pixels[1].requests == [[(1, 0, 0), (0, 1, 0)]]
+    assert pixels[2].requests == [[(0, 1, 0)], [(0, 0, 0)]]
+    assert conn.queries == [("Image", [1, 2])]
+
+
+def test_omero_backend_save_image_streams_planes_in_zc_order() -> None:
+    uploaded = {}
+
+    class ConnectionStub:
+        def getObject(self, object_type, object_id):
+            return object()
+
+        def createImageFromNumpySeq(self, planes, name, **kwargs):
+            uploaded["planes"] = [plane.copy() for plane in planes]
+            uploaded.update(kwargs)
+            return type("ImageStub", (), {"getId": lambda self: 1})()
+
+    backend = object.__new__(OMEROLocalBackend)
+    backend._get_connection = lambda **kwargs: ConnectionStub()
+    data = np.arange(2 * 3 * 4 * 5, dtype=np.uint16).reshape(2, 3, 4, 5)[..., ::-1]
+
+    backend._save_image(data, Path("out.tif"), dataset_id=1)
+
+    assert (uploaded["sizeZ"], uploaded["sizeC"]) == (2, 3)
+    expected = [data[z, c] for z in range(2) for c in range(3)]
+    for plane, expected_plane in zip(uploaded["planes"], expected, strict=True):
+        np.testing.assert_array_equal(plane, expected_plane)
+
+
 def test_omero_backend_projects_save_context_from_base_plate_metadata() -> None:
     backend = object.__new__(OMEROLocalBackend)
     backend._plate_metadata = {
@@ -109,6 +109,16 @@ class TestMemoryBackend:
         npy_files = self.backend.list_files("/test", extensions={".npy"})
         assert len(npy_files) == 2
 
+    def test_list_files_with_pattern_filter(self):
+        """Test listing files with a glob pattern filter."""
+        self.backend.save(np.array([1]), "/test/A01_w1.npy")
+        self.backend.save(np.array([2]), "/test/A01_w2.npy")
+        self.backend.save(np.array([3]), "/test/B01_w1.npy")
+
+        files = self.backend.list_files("/test", pattern="*_w1.*")
+
+        assert {path.name for path in files} == {"A01_w1.npy", "B01_w1.npy"}
+
     def test_list_files_extension_filter_is_case_insensitive(self):
         """Test extension filtering matches backend contract case-insensitively."""
         self.backend.save(np.array([1]), "/test/image.TIF")
@@ -196,3 +196,62 @@ def test_load_rois_from_json_decodes_shapes_through_nominal_registry(tmp_path):
     assert isinstance(rois[0].shapes[0], PolygonShape)
     assert isinstance(rois[0].shapes[1], MaskShape)
     assert rois[0].shapes[1].bbox == (10, 20, 12, 22)
+
+
+def test_fiji_roi_transmission_matches_encoded_imagej_bytes():
+    pytest.importorskip("roifile")
+    from polystore.roi_converters import FijiROIConverter
+
+    rois = [
+        ROI(
+            shapes=[
+                PolygonShape(
+                    np.array([[10, 20], [10, 22], [12, 22]], dtype=float)
+                )
+            ],
+            metadata={"label": 3},
+        )
+    ]
+
+    encoded = FijiROIConverter.rois_to_transmission(rois)
+
+    assert encoded == FijiROIConverter.encode_rois_for_transmission(
+        FijiROIConverter.rois_to_imagej_bytes(rois)
+    )
+    assert FijiROIConverter.decode_rois_from_transmission(encoded) == (
+        FijiROIConverter.rois_to_imagej_bytes(rois)
+    )
+
+
+def test_fiji_roi_members_use_stable_imagej_names():
+    pytest.importorskip("roifile")
+    from polystore.roi_converters import FijiROIConverter
+
+    square = np.array([[0, 0], [0, 2], [2, 2]], dtype=float)
+    rois = [
+        ROI(shapes=[PolygonShape(square), PolygonShape(square + 5)], metadata={"label": 1}),
+        ROI(shapes=[EllipseShape(center_y=4, center_x=4, radius_y=1, radius_x=2)], metadata={}),
+    ]
+
+    members = FijiROIConverter.rois_to_imagej_members(rois, roi_prefix="A01")
+
+    assert [member.imagej_roi.name for member in members] == [
+        FijiROIConverter.imagej_roi_name(roi_prefix="A01", roi_index=1, shape_index=1),
+        FijiROIConverter.imagej_roi_name(roi_prefix="A01", roi_index=1, shape_index=2),
+        FijiROIConverter.imagej_roi_name(roi_prefix="A01", roi_index=2, shape_index=1),
+    ]
+    assert members[0].metadata == {"label": 1}
+    assert members[0].metadata is not members[1].metadata
+
+
+def test_imagej_polygon_projection_swaps_yx_to_xy():
+    pytest.importorskip("roifile")
+    from polystore.roi_converters import ImageJROIShapeConverter
+
+    coordinates = np.array([[1, 10], [2, 20], [3, 30]], dtype=float)
+    shape = PolygonShape(coordinates)
+
+    imagej_roi = ImageJROIShapeConverter.for_shape(shape).imagej_roi(shape, "ROI_1_1")
+
+    np.testing.assert_allclose(imagej_roi.coordinates(), coordinates[:, [1, 0]])
+    np.testing.assert_array_equal(shape.coordinates, coordinates)
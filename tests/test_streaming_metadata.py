@@ -1,3 +1,4 @@
+import json
 from types import SimpleNamespace
 
 import pytest
@@ -366,3 +367,208 @@ def test_viewer_ack_policy_rejects_error_status_and_cleans_up() -> None:
         )
 
     assert cleanup_calls == ["cleanup"]
+
+
+@pytest.mark.parametrize("orjson_available", [True, False])
+def test_streaming_wire_codec_round_trips_compact_json(
+    monkeypatch,
+    orjson_available,
+) -> None:
+    from polystore.streaming import StreamingWireCodec, _streaming_backend
+
+    if orjson_available and _streaming_backend.orjson is None:
+        pytest.skip("orjson not installed")
+    monkeypatch.setattr(_streaming_backend, "ORJSON_AVAILABLE", orjson_available)
+
+    message = {
+        "images": [{"path": "A01.tif", "shape": (2, 3), "dtype": "uint16"}],
+        "display_config": {"component_order": ["well"]},
+    }
+
+    frame = StreamingWireCodec.encode(message)
+
+    assert b" " not in frame
+    assert json.loads(frame.decode("utf-8")) == StreamingWireCodec.decode(frame)
+    assert StreamingWireCodec.decode(frame)["images"][0]["shape"] == [2, 3]
+
+
+class _BatchTrackerStub:
+    def __init__(self):
+        self.batches = []
+
+    def register_sent_batch(self, image_ids):
+        self.batches.append(list(image_ids))
+
+
+class _SingleTrackerStub:
+    def __init__(self):
+        self.sent = []
+
+    def register_sent(self, image_id):
+        self.sent.append(image_id)
+
+
+@pytest.mark.parametrize("tracker_type", [_BatchTrackerStub, _SingleTrackerStub])
+def test_streaming_backend_registers_batch_image_ids_with_tracker(
+    monkeypatch,
+    tracker_type,
+) -> None:
+    from zmqruntime.config import ZMQConfig
+
+    from polystore.streaming import _streaming_backend
+
+    tracker = tracker_type()
+    monkeypatch.setattr(
+        _streaming_backend,
+        "GlobalAckListener",
+        lambda: SimpleNamespace(start=lambda **kwargs: None),
+    )
+    monkeypatch.setattr(
+        _streaming_backend,
+        "GlobalQueueTrackerRegistry",
+        lambda: SimpleNamespace(get_or_create_tracker=lambda port, viewer: tracker),
+    )
+
+    MetadataProbeStreamingBackend()._register_with_queue_tracker(
+        ViewerTransportEndpoint(host="127.0.0.1", port=5555, transport_mode=TransportMode.TCP),
+        ["a", "b", "c"],
+        transport_config=ZMQConfig(),
+    )
+
+    registered = getattr(tracker, "batches", None) or [tracker.sent]
+    assert registered == [["a", "b", "c"]]
+
+
+def test_streaming_image_ids_are_unique_process_prefixed_strings() -> None:
+    import os
+
+    from polystore.streaming._streaming_backend import StreamingImageIdAuthority
+
+    first = StreamingImageIdAuthority.allocate(3)
+    second = StreamingImageIdAuthority.allocate(2)
+
+    assert len(set(first + second)) == 5
+    assert all(image_id.startswith(f"{os.getpid():x}-") for image_id in first + second)
+    session = first[0].rsplit("-", 1)[0]
+    assert all(image_id.rsplit("-", 1)[0] == session for image_id in second)
+
+    token = StreamingImageIdAuthority.next_token()
+    assert token.startswith(session.split("-")[1] + "_")
+    assert token != StreamingImageIdAuthority.next_token()
+
+
+def test_streaming_backend_reuses_viewer_socket_per_thread() -> None:
+    import threading
+
+    import zmq
+
+    backend = MetadataProbeStreamingBackend()
+    policy = ViewerAckPolicy(viewer_name="Probe", timeout_ms=100)
+    url = "tcp://127.0.0.1:59999"
+    try:
+        key, socket = backend._get_viewer_socket(url, policy)
+        assert backend._get_viewer_socket(url, policy) == (key, socket)
+        assert socket.getsockopt(zmq.IMMEDIATE) == 1
+        assert socket.getsockopt(zmq.SNDBUF) == 16 * 1024 * 1024
+
+        other = []
+        thread = threading.Thread(
+            target=lambda: other.append(backend._get_viewer_socket(url, policy))
+        )
+        thread.start()
+        thread.join()
+        other_key, other_socket = other[0]
+        assert other_socket is not socket
+        assert other_socket.closed
+        assert other_key not in backend._publishers
+
+        backend._discard_viewer_socket(key)
+        assert socket.closed
+        assert key not in backend._publishers
+    finally:
+        backend.cleanup()
+
+
+def test_streaming_backend_background_send_drains_batches_in_order() -> None:
+    import threading
+
+    sent = []
+
+    class BackgroundProbeBackend(StreamingBackend):
+        VIEWER_TYPE = "probe"
+        SHM_PREFIX = "probe_"
+        BACKGROUND_SEND = True
+
+        _prepare_batch_item = MetadataProbeStreamingBackend._prepare_batch_item
+
+        def _register_with_queue_tracker(self, *args, **kwargs):
+            pass
+
+        def _send_built_batch(self, transport_endpoint, url, built_batch):
+            sent.append(
+                (threading.current_thread().name, built_batch.batch_images[0]["path"])
+            )
+
+    backend = BackgroundProbeBackend()
+    viewer_request = stream_request(SimpleNamespace(parser=None, metadata_handler=None))
+    backend.save_batch(["first"], ["A01.tif"], stream_request=viewer_request)
+    backend.save_batch(["second"], ["A02.tif"], stream_request=viewer_request)
+    backend.cleanup()
+
+    assert [path for _, path in sent] == ["A01.tif", "A02.tif"]
+    assert {name for name, _ in sent} == {"polystore-probe-sender"}
+    assert backend._sender_thread is None
+
+
+def test_streaming_backend_background_send_failure_reaches_next_caller() -> None:
+    class FailingBackgroundBackend(StreamingBackend):
+        VIEWER_TYPE = "probe"
+        SHM_PREFIX = "probe_"
+        BACKGROUND_SEND = True
+
+        _prepare_batch_item = MetadataProbeStreamingBackend._prepare_batch_item
+
+        def _register_with_queue_tracker(self, *args, **kwargs):
+            pass
+
+        def _send_built_batch(self, transport_endpoint, url, built_batch):
+            raise ConnectionError("viewer gone")
+
+    backend = FailingBackgroundBackend()
+    viewer_request = stream_request(SimpleNamespace(parser=None, metadata_handler=None))
+    backend.save_batch(["first"], ["A01.tif"], stream_request=viewer_request)
+    backend._stop_sender_thread()
+
+    with pytest.raises(ConnectionError, match="viewer gone"):
+        backend.save_batch(["second"], ["A02.tif"], stream_request=viewer_request)
+    backend.save_batch(["third"], ["A03.tif"], stream_request=viewer_request)
+    with pytest.raises(ConnectionError, match="viewer gone"):
+        backend.cleanup()
+    backend.cleanup()
+
+
+def test_napari_backend_dispatches_vector_payloads_by_data_type() -> None:
+    import numpy as np
+
+    from polystore.napari_stream import NapariStreamingBackend
+    from polystore.roi import ROI, PolygonShape
+
+    backend = NapariStreamingBackend()
+    rois = [
+        ROI(
+            shapes=[PolygonShape(np.array([[0, 0], [0, 4], [4, 4]], dtype=float))],
+            metadata={"label": 1},
+        )
+    ]
+
+    payload = backend._prepare_batch_item(
+        StreamingItemPreparationRequest(
+            data=rois,
+            item_path=StreamingItemPath("A01_rois.roi.zip"),
+            streaming_data_type=StreamingDataType.SHAPES,
+        )
+    )
+
+    assert payload.streaming_data_type is StreamingDataType.SHAPES
+    assert "shapes" in payload.item_payload
+    assert "shm_name" not in payload.item_payload
@@ -3,8 +3,10 @@ from __future__ import annotations
 import threading
 import time
 
+import pytest
 from zmqruntime.viewer_protocol import ViewerBatchDisplayPayload
 
+from polystore.streaming.base import GenericComponentAccessor
 from polystore.streaming.identity import (
     FixedStreamProducerIdentityKind,
     StreamProducerDisplayNameAuthority,
@@ -98,10 +100,10 @@ def test_group_items_by_component_modes_keys_windows_by_producer_identity() -> N
         ),
     )
 
-    assert grouped.window_components == []
-    assert grouped.channel_components == ["channel"]
-    assert grouped.frame_components == ["well"]
-    assert grouped.slice_components == []
+    assert grouped.window_components == ()
+    assert grouped.channel_components == ("channel",)
+    assert grouped.frame_components == ("well",)
+    assert grouped.slice_components == ()
     assert grouped.fixed_window_labels[
         "origin_pipeline_kind_artifact_projection_Nuclei_step_2_name_Segment"
     ] == (("producer", "3. Segment Nuclei"),)
@@ -111,6 +113,64 @@ def test_group_items_by_component_modes_keys_windows_by_producer_identity() -> N
     }
 
 
+def test_group_items_by_component_modes_reuses_keys_per_window_coordinate() -> None:
+    identity = PipelineProducerFixture.main_output(
+        step_name="RawLoad",
+        pipeline_position=0,
+    )
+    items = [
+        {
+            "data_type": "image",
+            "metadata": {"well": well, "channel": channel},
+            "producer_identity": identity.to_payload(),
+        }
+        for well, channel in (("A01", 1), ("A01", 2), (1, 1), (True, 1))
+    ]
+
+    grouped = group_items_by_component_modes(
+        WindowProjectionSource.from_wire_payloads(items),
+        display_layout=ViewerBatchDisplayPayload(
+            component_modes={"well": "window", "channel": "channel"},
+            component_order=["well", "channel"],
+        ),
+    )
+
+    route = "origin_pipeline_kind_main_projection_main_step_0_name_RawLoad"
+    assert [len(window) for window in grouped.windows.values()] == [2, 1, 1]
+    assert list(grouped.windows) == [
+        f"{route}_well_A01",
+        f"{route}_well_1",
+        f"{route}_well_True",
+    ]
+    assert grouped.fixed_window_labels[f"{route}_well_A01"] == (
+        ("producer", "1. RawLoad"),
+        ("well", "A01"),
+    )
+
+
+def test_group_items_by_component_modes_rejects_missing_declared_component() -> None:
+    identity = PipelineProducerFixture.main_output(
+        step_name="RawLoad",
+        pipeline_position=0,
+    )
+    items = [
+        {
+            "data_type": "image",
+            "metadata": {"well": "A01"},
+            "producer_identity": identity.to_payload(),
+        }
+    ]
+
+    with pytest.raises(ValueError, match="'channel'"):
+        group_items_by_component_modes(
+            WindowProjectionSource.from_wire_payloads(items),
+            display_layout=ViewerBatchDisplayPayload(
+                component_modes={"well": "window", "channel": "channel"},
+                component_order=["well", "channel"],
+            ),
+        )
+
+
 def test_named_main_outputs_share_projection_and_keep_exact_provenance() -> None:
     first = PipelineProducerFixture.main_output(
         output_key="Stain1",
@@ -352,6 +412,47 @@ def test_normalize_component_layout_dict_config() -> None:
     assert display_layout.component_modes["well"] == "slice"
 
 
+def test_normalize_component_layout_reuses_layout_for_equal_configs() -> None:
+    def display_config() -> dict:
+        return {
+            "component_modes": {"well": "slice", "channel": "stack"},
+            "component_order": ["well", "channel"],
+        }
+
+    assert normalize_component_layout(display_config()) is normalize_component_layout(
+        display_config()
+    )
+
+
+def test_generic_component_accessor_indexes_components_by_mode() -> None:
+    accessor = GenericComponentAccessor(
+        {
+            "component_modes": {"well": "window", "channel": "channel", "z": "channel"},
+            "component_order": ["z", "well", "channel"],
+        },
+        [],
+    )
+
+    assert accessor.get_by_mode("channel") == ("z", "channel")
+    assert accessor.get_by_mode("window") == ("well",)
+    assert accessor.get_by_mode("frame") == ()
+
+
+def test_generic_component_accessor_collects_sorted_unique_values() -> None:
+    accessor = GenericComponentAccessor(
+        {"component_modes": {}, "component_order": []},
+        [
+            {"metadata": {"channel": 2, "z": 1}},
+            {"metadata": {"channel": 1}},
+            {"metadata": {"channel": 2, "z": 1}},
+        ],
+    )
+
+    assert accessor.collect_values(["channel"]) == [(1,), (2,)]
+    assert accessor.collect_values(("channel", "z")) == [(1, 0), (2, 1)]
+    assert accessor.collect_values(()) == [()]
+
+
 def test_debounced_batch_engine_flush_processes_pending_once() -> None:
     processed: list[tuple[list[dict], dict]] = []
 
@@ -479,3 +580,126 @@ def test_debounced_batch_engine_enqueue_not_blocked_by_processing() -> None:
     assert len(processed) == 2
     assert processed[0][0] == [{"id": 1}]
     assert processed[1][0] == [{"id": 2}]
+
+
+def test_debounced_batch_engine_worker_processes_after_debounce_delay() -> None:
+    processed = threading.Event()
+    batches: list[list[dict]] = []
+
+    def _process(items, _context):
+        batches.append(items)
+        processed.set()
+
+    engine = DebouncedBatchEngine(
+        process_fn=_process, debounce_delay_ms=20, max_debounce_wait_ms=1_000
+    )
+    threads_before = threading.active_count()
+    for item_id in range(50):
+        engine.enqueue(items=[{"id": item_id}], context={"window_key": "image"})
+
+    assert threading.active_count() <= threads_before + 1
+    assert processed.wait(timeout=2.0)
+    assert batches == [[{"id": item_id} for item_id in range(50)]]
+    engine.close()
+
+
+def test_debounced_batch_engine_worker_exits_when_idle() -> None:
+    processed = threading.Event()
+
+    engine = DebouncedBatchEngine(
+        process_fn=lambda _items, _context: processed.set(),
+        debounce_delay_ms=50,
+        max_debounce_wait_ms=1_000,
+    )
+    engine.enqueue(items=[{"id": 1}], context={"window_key": "image"})
+    worker = engine._worker
+
+    assert processed.wait(timeout=2.0)
+    worker.join(timeout=2.0)
+    assert not worker.is_alive()
+    assert engine._worker is None
+
+    processed.clear()
+    engine.enqueue(items=[{"id": 2}], context={"window_key": "image"})
+    assert engine._worker is not None and engine._worker is not worker
+    assert processed.wait(timeout=2.0)
+    engine.close()
+
+
+def test_debounced_batch_engine_close_flushes_and_stops_worker() -> None:
+    processed: list[list[dict]] = []
+
+    engine = DebouncedBatchEngine(
+        process_fn=lambda items, _context: processed.append(items),
+        debounce_delay_ms=10_000,
+        max_debounce_wait_ms=20_000,
+    )
+    engine.enqueue(items=[{"id": 1}], context={"window_key": "image"})
+    worker = engine._worker
+
+    engine.close()
+
+    assert processed == [[{"id": 1}]]
+    assert worker is not None and not worker.is_alive()
+
+
+def test_fiji_batch_processor_close_processes_pending_items() -> None:
+    from polystore.streaming.receivers.fiji import FijiBatchProcessor
+
+    processed: list[dict] = []
+
+    class _WireItems:
+        def process_wire_items(self, **kwargs):
+            processed.append(kwargs)
+
+    class _Server:
+        batch_processor = _WireItems()
+
+    processor = FijiBatchProcessor(
+        _Server(), debounce_delay_ms=10_000, max_debounce_wait_ms=20_000
+    )
+    processor.add_items(
+        window_key="image",
+        items=[{"id": 1}],
+        display_config={},
+        images_dir="images",
+        component_names_metadata={},
+        component_value_domain={},
+    )
+    processor.close()
+
+    assert [call["items"] for call in processed] == [[{"id": 1}]]
+
+
+def test_fiji_batch_processor_coalesces_bursts_for_one_window() -> None:
+    from polystore.streaming.receivers.fiji import FijiBatchProcessor
+
+    processed: list[dict] = []
+
+    class _WireItems:
+        def process_wire_items(self, **kwargs):
+            processed.append(kwargs)
+
+    class _Server:
+        batch_processor = _WireItems()
+
+    processor = FijiBatchProcessor(
+        _Server(), debounce_delay_ms=10_000, max_debounce_wait_ms=20_000
+    )
+    display_config = {"component_order": ["channel"]}
+    for item_id in range(3):
+        processor.add_items(
+            window_key="image",
+            items=[{"id": item_id}],
+            display_config=display_config,
+            images_dir="images",
+            component_names_metadata={},
+            component_value_domain={},
+        )
+    processor.flush()
+
+    assert [call["items"] for call in processed] == [
+        [{"id": 0}, {"id": 1}, {"id": 2}]
+    ]
+    assert processor._context_by_window == {}
+    processor.close()
@@ -93,3 +93,259 @@ def test_receiver_closes_attachment_when_array_projection_fails(monkeypatch) ->
         )
 
     assert memory.closed
+
+
+def test_sender_allocation_copies_payload_into_shared_memory() -> None:
+    source = np.arange(12, dtype=np.uint16).reshape(3, 4)
+
+    block = StreamingSharedMemoryAuthority.create(
+        _streaming_backend.StreamingSharedMemoryRequest(
+            data=source,
+            item_path=_streaming_backend.StreamingItemPath("A01.tif"),
+            shm_prefix="test_",
+        )
+    )
+    try:
+        shared = np.ndarray(
+            block.payload.shape,
+            dtype=block.payload.dtype,
+            buffer=block.shared_memory.buf,
+        )
+        np.testing.assert_array_equal(shared, source)
+        assert block.payload.shm_name.startswith("test_")
+        del shared
+    finally:
+        block.shared_memory.close()
+        block.shared_memory.unlink()
+
+
+def test_backend_allocated_arrays_stream_without_copy() -> None:
+    class AllocationProbeBackend(_streaming_backend.StreamingBackend):
+        VIEWER_TYPE = "probe"
+        SHM_PREFIX = "probe_"
+
+    backend = AllocationProbeBackend()
+    try:
+        array = backend.allocate_shared_array((3, 4), np.uint16)
+        array[:] = np.arange(12, dtype=np.uint16).reshape(3, 4)
+
+        payload = backend.create_shared_memory_payload(array, "A01.tif")
+        shm = backend._shared_memory_blocks[payload["shm_name"]]
+
+        assert backend._allocated_blocks == {}
+        shared = np.ndarray((3, 4), dtype=np.uint16, buffer=shm.buf)
+        assert np.shares_memory(shared, array)
+        del shared, array
+    finally:
+        backend.cleanup()
+
+
+def test_acknowledged_allocated_arrays_are_unlinked_not_pooled() -> None:
+    class PooledAllocationBackend(_streaming_backend.StreamingBackend):
+        VIEWER_TYPE = "probe"
+        SHM_PREFIX = "probe_"
+        SHM_POOL_MAX_BYTES = 1 << 20
+
+    backend = PooledAllocationBackend()
+    try:
+        array = backend.allocate_shared_array((3, 4), np.uint16)
+        array[:] = 7
+        payload = backend.create_shared_memory_payload(array, "A01.tif")
+
+        backend._recycle_shared_memory_blocks([payload])
+
+        assert backend._shm_pool.pooled_bytes == 0
+        with pytest.raises(FileNotFoundError):
+            _streaming_backend.shared_memory.SharedMemory(name=payload["shm_name"])
+        reused = backend.allocate_shared_array((3, 4), np.uint16)
+        reused[:] = 9
+        assert (array == 7).all()
+        del array, reused
+    finally:
+        backend.cleanup()
+    assert backend._exported_blocks == []
+
+
+def test_shared_memory_pool_reuses_released_blocks_by_size_bucket() -> None:
+    pool = _streaming_backend.StreamingSharedMemoryPool(max_pool_bytes=1 << 20)
+    try:
+        first = pool.acquire(5000, "test_")
+        assert first.size == pool.bucket_size(5000) == 8192
+        pool.release(first)
+        assert pool.pooled_bytes == 8192
+
+        reused = pool.acquire(6000, "test_")
+        assert reused is first
+        assert pool.pooled_bytes == 0
+        pool.release(reused)
+    finally:
+        pool.clear()
+    assert pool.pooled_bytes == 0
+
+
+def test_shared_memory_pool_unlinks_blocks_beyond_capacity() -> None:
+    pool = _streaming_backend.StreamingSharedMemoryPool(max_pool_bytes=4096)
+    retained = pool.acquire(100, "test_")
+    overflow = pool.acquire(100, "test_")
+    try:
+        pool.release(retained)
+        pool.release(overflow)
+        assert pool.pooled_bytes == 4096
+        with pytest.raises(FileNotFoundError):
+            _streaming_backend.shared_memory.SharedMemory(name=overflow.name)
+    finally:
+        pool.clear()
+
+
+def test_shared_memory_pool_unlinks_blocks_idle_beyond_ttl(monkeypatch) -> None:
+    clock = iter([100.0, 200.0])
+    monkeypatch.setattr(_streaming_backend.time, "monotonic", lambda: next(clock))
+    pool = _streaming_backend.StreamingSharedMemoryPool(
+        max_pool_bytes=1 << 20,
+        idle_ttl_seconds=30.0,
+    )
+    stale = pool.acquire(100, "test_")
+    fresh = pool.acquire(10000, "test_")
+    try:
+        pool.release(stale)
+        pool.release(fresh)
+        assert pool.pooled_bytes == fresh.size
+        with pytest.raises(FileNotFoundError):
+            _streaming_backend.shared_memory.SharedMemory(name=stale.name)
+    finally:
+        pool.clear()
+
+
+def _unlinking_receiver(payload) -> np.ndarray:
+    """Copy a payload and unlink it, as zmqruntime's image server does."""
+    shm = _streaming_backend.shared_memory.SharedMemory(name=payload["shm_name"])
+    try:
+        return np.ndarray(
+            payload["shape"], dtype=payload["dtype"], buffer=shm.buf
+        ).copy()
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def test_backend_unlinks_acknowledged_blocks_by_default() -> None:
+    class ProbeBackend(_streaming_backend.StreamingBackend):
+        VIEWER_TYPE = "probe"
+        SHM_PREFIX = "probe_"
+
+    source = np.arange(8, dtype=np.uint16).reshape(2, 4)
+    backend = ProbeBackend()
+    try:
+        kept = backend.create_shared_memory_payload(source, "A01.tif")
+        unlinked = backend.create_shared_memory_payload(source, "A02.tif")
+        _unlinking_receiver(unlinked)
+
+        backend._recycle_shared_memory_blocks([kept, unlinked])
+
+        assert backend._shm_pool.pooled_bytes == 0
+        with pytest.raises(FileNotFoundError):
+            _streaming_backend.shared_memory.SharedMemory(name=kept["shm_name"])
+    finally:
+        backend.cleanup()
+
+
+def test_pooled_reuse_skips_blocks_an_unlinking_receiver_removed() -> None:
+    class PooledProbeBackend(_streaming_backend.StreamingBackend):
+        VIEWER_TYPE = "probe"
+        SHM_PREFIX = "probe_"
+        SHM_POOL_MAX_BYTES = 1 << 20
+
+    source = np.arange(8, dtype=np.uint16).reshape(2, 4)
+    backend = PooledProbeBackend()
+    try:
+        first = backend.create_shared_memory_payload(source, "A01.tif")
+        np.testing.assert_array_equal(_unlinking_receiver(first), source)
+        backend._recycle_shared_memory_blocks([first])
+
+        second = backend.create_shared_memory_payload(source + 1, "A02.tif")
+
+        assert second["shm_name"] != first["shm_name"]
+        assert backend._shm_pool.pooled_bytes == 0
+        np.testing.assert_array_equal(_unlinking_receiver(second), source + 1)
+    finally:
+        backend.cleanup()
+
+
+class _HostDLPackArray:
+    """Foreign host array exposing only the DLPack protocol."""
+
+    def __init__(self, array):
+        self._array = array
+
+    def __dlpack__(self, *args, **kwargs):
+        return self._array.__dlpack__(*args, **kwargs)
+
+    def __dlpack_device__(self):
+        return self._array.__dlpack_device__()
+
+
+def test_host_dlpack_arrays_convert_without_copy() -> None:
+    source = np.arange(6, dtype=np.float32).reshape(2, 3)
+
+    converted = _streaming_backend.StreamingPayloadMemoryAuthority.to_numpy(
+        _HostDLPackArray(source)
+    )
+
+    assert np.shares_memory(converted, source)
+
+
+def test_array_interface_payloads_convert_without_copy() -> None:
+    source = np.arange(6, dtype=np.uint8).reshape(2, 3)
+
+    class HostArrayInterface:
+        __array_interface__ = source.__array_interface__
+
+    converted = _streaming_backend.StreamingPayloadMemoryAuthority.to_numpy(
+        HostArrayInterface()
+    )
+
+    assert np.shares_memory(converted, source)
+    assert converted.flags.c_contiguous
+
+
+def test_device_arrays_copy_directly_into_shared_memory(monkeypatch) -> None:
+    class DeviceArrayStub:
+        shape = (2, 4)
+        dtype = "torch.uint16"
+
+        def __init__(self, array):
+            self.array = array
+
+    copies = []
+
+    def copy_to_host(data, out):
+        copies.append(out)
+        out[...] = data.array
+
+    monkeypatch.setattr(
+        _streaming_backend.StreamingPayloadMemoryAuthority,
+        "direct_host_copy",
+        classmethod(
+            lambda cls, data: copy_to_host if isinstance(data, DeviceArrayStub) else None
+        ),
+    )
+
+    class DeviceProbeBackend(_streaming_backend.StreamingBackend):
+        VIEWER_TYPE = "probe"
+        SHM_PREFIX = "probe_"
+
+    source = np.arange(8, dtype=np.uint16).reshape(2, 4)
+    backend = DeviceProbeBackend()
+    try:
+        payload = backend.create_shared_memory_payload(DeviceArrayStub(source), "A01.tif")
+        shm = backend._shared_memory_blocks[payload["shm_name"]]
+
+        assert payload["dtype"] == "uint16"
+        assert len(copies) == 1
+        np.testing.assert_array_equal(
+            np.ndarray((2, 4), dtype=np.uint16, buffer=shm.buf),
+            source,
+        )
+        del copies[:]
+    finally:
+        backend.cleanup()
@@ -154,3 +154,54 @@ def test_viewer_stream_backend_rejects_non_request_payload() -> None:
         ViewerStreamBackendKwargs.from_kwargs(
             {ViewerStreamKwarg.STREAM_REQUEST.value: DisplayConfigFixture()}
         )
+
+
+def test_viewer_display_semantics_are_reused_for_frozen_display_configs() -> None:
+    from dataclasses import dataclass
+
+    from polystore.streaming.viewer_transport import ViewerStreamDisplaySemantics
+
+    @dataclass(frozen=True)
+    class FrozenDisplayConfig(ViewerDisplayConfigABC):
+        COMPONENT_ORDER = ("well", "channel")
+
+        def component_modes(self):
+            return {"well": "stack", "channel": "channel"}
+
+    first = required_stream_request(display_config=FrozenDisplayConfig())
+    second = required_stream_request(display_config=FrozenDisplayConfig())
+    mutable = required_stream_request()
+
+    assert first.display_semantics is first.display_semantics
+    assert first.display_semantics is second.display_semantics
+    assert dict(first.display_semantics.component_modes) == {
+        "well": "stack",
+        "channel": "channel",
+    }
+    assert mutable.display_semantics is not (
+        ViewerStreamDisplaySemantics.for_display_config(mutable.display_config)
+    )
+
+
+@pytest.mark.parametrize(
+    "profile_name",
+    ["LATENCY", "BALANCED", "THROUGHPUT"],
+)
+def test_viewer_socket_profiles_set_send_queue_and_buffer(profile_name) -> None:
+    import zmq
+
+    from polystore.streaming.viewer_transport import ViewerSocketProfile, ViewerTransportDefaults
+
+    profile = ViewerSocketProfile[profile_name]
+    context = zmq.Context()
+    socket = context.socket(zmq.REQ)
+    try:
+        ViewerTransportDefaults().apply_socket_options(socket, profile)
+
+        assert socket.getsockopt(zmq.IMMEDIATE) == 1
+        assert socket.getsockopt(zmq.SNDHWM) == profile.value.send_hwm
+        assert socket.getsockopt(zmq.SNDBUF) == profile.value.send_buffer_bytes
+        assert socket.getsockopt(zmq.TCP_KEEPALIVE) == 1
+    finally:
+        socket.close(linger=0)
+        context.term()